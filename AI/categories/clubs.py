@@ -774,6 +774,10 @@ class ClubSystem:
             self.exit_program()
 
 
-if __name__ == "__main__":
+def main():
     system = ClubSystem()
-    system.run()
\ No newline at end of file
+    system.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -326,7 +326,11 @@ class CourseSystem:
         sys.exit(0)
 
 
-if __name__ == "__main__":
+def main():
     json_file = "./jsonFiles/courses.json"
     system = CourseSystem(json_file)
-    system.main_menu()
\ No newline at end of file
+    system.main_menu()
+
+
+if __name__ == "__main__":
+    main()
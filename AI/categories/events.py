@@ -2,16 +2,30 @@ import json
 import os
 import sys
 import datetime
-from datetime import datetime as dt
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parsed JSON files keyed by path, reused while the file's mtime and size are unchanged
+_JSON_CACHE = {}
+
+
+@lru_cache(maxsize=4096)
+def _parse_ymd(date):
+    """Parse a YYYY-MM-DD string into a date (raises ValueError like strptime)"""
+    year, month, day = date.split("-")
+    return datetime.date(int(year), int(month), int(day))
 
 
 class EventsSystem:
     def __init__(self, json_file=None, events_data=None):
         """Initialize with either a JSON file or direct events data"""
         if json_file and os.path.exists(json_file):
-            with open(json_file, "r") as f:
-                self.data = json.load(f)
-                self.events = self.data.get("events", [])
+            self.data = self.load_json(json_file)
+            self.events = self.data.get("events", [])
         elif events_data:
             # Load data directly from provided dictionary
             self.events = events_data.get("events", [])
@@ -24,6 +38,24 @@ class EventsSystem:
         # Create category mappings
         self.build_mappings()
     
+    @staticmethod
+    def load_json(json_file):
+        """Parse a JSON file, with orjson when it is installed"""
+        st = os.stat(json_file)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _JSON_CACHE.get(json_file)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        
+        if orjson is not None:
+            with open(json_file, "rb") as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(json_file, "r") as f:
+                data = json.load(f)
+        _JSON_CACHE[json_file] = (stamp, data)
+        return data
+    
     def sort_events(self):
         """Sort events by date and time"""
         def event_sort_key(event):
@@ -41,8 +73,12 @@ class EventsSystem:
         self.event_types = set()
         self.locations = set()
         self.dates = set()
+        # Events grouped by date string, in sorted order, for date lookups
+        self.events_by_date = {}
         
         for event in self.events:
+            self.events_by_date.setdefault(event.get("date", "No date"), []).append(event)
+            
             # Extract event types based on common naming patterns
             name = event.get("name", "").lower()
             
@@ -66,7 +102,7 @@ class EventsSystem:
             date = event.get("date", "")
             if date:
                 try:
-                    date_obj = dt.strptime(date, "%Y-%m-%d")
+                    date_obj = _parse_ymd(date)
                     month_name = date_obj.strftime("%B %Y")
                     self.event_types.add(month_name)
                     self.dates.add(date)
@@ -88,27 +124,7 @@ class EventsSystem:
     def display_event_info(self, event_index):
         """Display detailed information for a specific event."""
         if 0 <= event_index < len(self.events):
-            event = self.events[event_index]
-            print(f"\nEvent: {event.get('name', 'Unnamed Event')}")
-            print(f"Date: {event.get('date', 'No date specified')}")
-            
-            time = event.get('time', '')
-            if time:
-                print(f"Time: {time}")
-            
-            location = event.get('location', '')
-            if location:
-                print(f"Location: {location}")
-            
-            description = event.get('description', '')
-            if description:
-                print(f"\nDescription: {description}")
-            
-            link = event.get('link', '')
-            if link:
-                print(f"\nEvent Link: {link}")
-            
-            input("\nPress Enter to continue...")
+            self.display_single_event(self.events[event_index])
         else:
             print("Event not found. Please check the event number.")
 
@@ -132,7 +148,7 @@ class EventsSystem:
         elif choice == "2":
             print("\nEnter date in format YYYY-MM-DD (e.g., 2025-04-15)")
             search_date = input("Date: ").strip()
-            results = [e for e in self.events if e.get("date", "") == search_date]
+            results = self.events_by_date.get(search_date, [])
         elif choice == "3":
             # Show list of available locations
             if not self.locations:
@@ -181,13 +197,8 @@ class EventsSystem:
 
     def display_events_by_date(self):
         """Display events organized by date"""
-        # Group events by date
-        events_by_date = {}
-        for event in self.events:
-            date = event.get("date", "No date")
-            if date not in events_by_date:
-                events_by_date[date] = []
-            events_by_date[date].append(event)
+        # Events are grouped by date once in build_mappings
+        events_by_date = self.events_by_date
         
         # Sort dates
         sorted_dates = sorted(events_by_date.keys())
@@ -217,7 +228,7 @@ class EventsSystem:
             # Display events for each date in the current page
             for i, date in enumerate(future_dates[start_idx:end_idx], start_idx+1):
                 try:
-                    date_obj = dt.strptime(date, "%Y-%m-%d")
+                    date_obj = _parse_ymd(date)
                     formatted_date = date_obj.strftime("%A, %B %d, %Y")
                     print(f"\n{i}. {formatted_date}")
                 except ValueError:
@@ -258,7 +269,7 @@ class EventsSystem:
     def display_events_for_date(self, date, events):
         """Display all events for a specific date with options to view details"""
         try:
-            date_obj = dt.strptime(date, "%Y-%m-%d")
+            date_obj = _parse_ymd(date)
             formatted_date = date_obj.strftime("%A, %B %d, %Y")
             print(f"\nEvents for {formatted_date}:")
         except ValueError:
@@ -299,24 +310,17 @@ class EventsSystem:
 
     def display_single_event(self, event):
         """Display detailed information for a single event"""
-        print(f"\nEvent: {event.get('name', 'Unnamed Event')}")
-        print(f"Date: {event.get('date', 'No date specified')}")
-        
-        time = event.get('time', '')
-        if time:
-            print(f"Time: {time}")
-        
-        location = event.get('location', '')
-        if location:
-            print(f"Location: {location}")
-        
-        description = event.get('description', '')
-        if description:
-            print(f"\nDescription: {description}")
-        
-        link = event.get('link', '')
-        if link:
-            print(f"\nEvent Link: {link}")
+        parts = [
+            f"\nEvent: {event.get('name', 'Unnamed Event')}",
+            f"Date: {event.get('date', 'No date specified')}"
+        ]
+        # Optional fields are only shown when they have a value
+        for key, label in (("time", "Time: "), ("location", "Location: "),
+                           ("description", "\nDescription: "), ("link", "\nEvent Link: ")):
+            value = event.get(key)
+            if value:
+                parts.append(f"{label}{value}")
+        print("\n".join(parts))
         
         input("\nPress Enter to continue...")
 
@@ -596,7 +600,7 @@ class EventsSystem:
         sys.exit(0)
 
 
-if __name__ == "__main__":
+def main():
     # Load from the specified JSON file path
     json_file = "./jsonFiles/events.json"
     
@@ -608,4 +612,8 @@ if __name__ == "__main__":
         sys.exit(1)
     
     # Start the system
-    system.main_menu()
\ No newline at end of file
+    system.main_menu()
+
+
+if __name__ == "__main__":
+    main()
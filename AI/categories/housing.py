@@ -848,6 +848,10 @@ class HousingSystem:
             self.exit_program()
 
 
-if __name__ == "__main__":
+def main():
     system = HousingSystem()
-    system.run()
\ No newline at end of file
+    system.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,33 +3,188 @@ import json
 import os
 import sys
 import re
-from collections import Counter
+from functools import cached_property
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ANSI sequence to clear the screen and move the cursor home
+_CLEAR_SCREEN = "\x1b[2J\x1b[H"
+
+# Digit runs in free-form capacity text
+_DIGITS_RE = re.compile(r'\d+')
+
+# Hours keywords used by the time-availability scoring, matched in a single pass
+_HOURS_RE = re.compile(r'(2am|24|sat|sun|weekend|10pm|evening|night)', re.IGNORECASE)
+HOURS_LATE = 1
+HOURS_WEEKEND = 2
+HOURS_EVENING = 4
+_HOURS_BIT = {
+    "2am": HOURS_LATE,
+    "24": HOURS_LATE,
+    "sat": HOURS_WEEKEND,
+    "sun": HOURS_WEEKEND,
+    "weekend": HOURS_WEEKEND,
+    "10pm": HOURS_EVENING,
+    "evening": HOURS_EVENING,
+    "night": HOURS_EVENING,
+}
+
+def _keyword_pattern(keywords):
+    """Compile keywords into one alternation that matches any of them as a substring."""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+# Define purpose keywords mapping
+PURPOSE_KEYWORDS = {
+    "General study": ["study spaces", "quiet study", "study areas"],
+    "Research": ["research assistance", "special collections", "reference"],
+    "Group project": ["group study", "collaboration", "group spaces"],
+    "Access special collections": ["rare books", "archives", "special collections"],
+    "Use specialized equipment": ["makerspace", "equipment", "computers", "technology"],
+    "Quiet reading": ["quiet", "reading", "quiet areas"]
+}
+
+# Define subject keywords mapping
+SUBJECT_KEYWORDS = {
+    "General/Humanities": ["general", "humanities", "history", "literature", "philosophy"],
+    "Science/Technology/Engineering/Math": ["science", "technology", "engineering", "mathematics", "stem"],
+    "Health Sciences/Medicine": ["health", "medical", "medicine", "nursing", "pharmacy"],
+    "Law": ["law", "legal", "government"],
+    "Architecture/Fine Arts": ["architecture", "fine arts", "design", "art", "visual"],
+    "Education": ["education", "teaching", "learning", "educational"]
+}
+
+_PURPOSE_PATTERNS = {purpose: _keyword_pattern(keywords) for purpose, keywords in PURPOSE_KEYWORDS.items()}
+_SUBJECT_PATTERNS = {subject: _keyword_pattern(keywords) for subject, keywords in SUBJECT_KEYWORDS.items()}
+
+# Integer codes for the matcher's "features" and "time" answers
+FEATURE_GROUP_STUDY = 0
+FEATURE_QUIET_STUDY = 1
+FEATURE_SPECIAL_COLLECTIONS = 2
+FEATURE_COMPUTERS = 3
+FEATURE_RESEARCH = 4
+FEATURE_LARGE_CAPACITY = 5
+_FEATURE_CODES = {
+    "Group study spaces": FEATURE_GROUP_STUDY,
+    "Quiet study areas": FEATURE_QUIET_STUDY,
+    "Special collections access": FEATURE_SPECIAL_COLLECTIONS,
+    "Computers and technology": FEATURE_COMPUTERS,
+    "Research assistance": FEATURE_RESEARCH,
+    "Large capacity": FEATURE_LARGE_CAPACITY,
+}
+
+# Listed features that satisfy a purpose or desired feature, with the reason shown
+_PURPOSE_FEATURE_RULES = {
+    "Research": ("research assistance", "Provides research assistance"),
+    "Group project": ("group study rooms", "Has group study rooms"),
+    "Quiet reading": ("quiet study areas", "Has quiet study areas"),
+}
+_FEATURE_RULES = {
+    FEATURE_GROUP_STUDY: ("group study rooms", "Has dedicated group study rooms"),
+    FEATURE_QUIET_STUDY: ("quiet study areas", "Has designated quiet study areas"),
+    FEATURE_COMPUTERS: ("computers", "Offers computer and technology resources"),
+    FEATURE_RESEARCH: ("research assistance", "Provides dedicated research assistance"),
+}
+
+TIME_WEEKDAY_DAYTIME = 0
+TIME_WEEKDAY_EVENING = 1
+TIME_LATE_NIGHT = 2
+TIME_WEEKEND = 3
+_TIME_CODES = {
+    "Weekday daytime": TIME_WEEKDAY_DAYTIME,
+    "Weekday evening (after 5pm)": TIME_WEEKDAY_EVENING,
+    "Late night (after 10pm)": TIME_LATE_NIGHT,
+    "Weekend": TIME_WEEKEND,
+}
 
 class LibrarySystem:
+    # Library info categories offered in the info menu
+    INFO_CATEGORIES = ("Location", "Capacity", "Hours", "Special Notes", "URL", "Phone", "Email", "Features", "Specializations")
+    INFO_CATEGORIES_WITH_ALL = INFO_CATEGORIES + ("All Information",)
+
     def __init__(self, json_file):
+        # The JSON file is only read the first time library data is needed
+        self._json_file = json_file
+        # Ranked scores per answer tuple; answers come from fixed menus, so it stays small
+        self._score_cache = {}
+
+    @cached_property
+    def data(self):
+        """Library data loaded from the JSON file on first access."""
         try:
-            with open(json_file, 'r') as f:
-                self.data = json.load(f)
-            self.libraries = self.data["libraries"]
-            self.matcher_questions = self.data["matcher_questions"]
+            if orjson is not None:
+                with open(self._json_file, 'rb') as f:
+                    return orjson.loads(f.read())
+            with open(self._json_file, 'r') as f:
+                return json.load(f)
         except FileNotFoundError:
-            print(f"Error: Could not find the JSON file '{json_file}'")
+            print(f"Error: Could not find the JSON file '{self._json_file}'")
             sys.exit(1)
         except json.JSONDecodeError:
-            print(f"Error: '{json_file}' is not a valid JSON file")
+            print(f"Error: '{self._json_file}' is not a valid JSON file")
             sys.exit(1)
+
+    @cached_property
+    def libraries(self):
+        return self.data["libraries"]
+
+    @cached_property
+    def matcher_questions(self):
+        matcher_questions = self.data["matcher_questions"]
+        for question_data in matcher_questions:
+            question_data["options"] = [sys.intern(option) for option in question_data["options"]]
+        return matcher_questions
+
+    @cached_property
+    def library_names(self):
+        """Library names in menu order, built once from the static library list."""
+        return [lib["name"] for lib in self.libraries]
+
+    @cached_property
+    def _libraries_by_name(self):
+        return {lib["name"]: lib for lib in self.libraries}
+
+    @cached_property
+    def _library_text(self):
+        """Lowercased (specializations, features, feature list) text per library."""
+        library_text = []
+        for lib in self.libraries:
+            features_list = lib.get("features", [])
+            library_text.append((
+                " ".join(lib.get("specializations", [])).lower(),
+                " ".join(features_list).lower(),
+                [feature.lower() for feature in features_list],
+            ))
+        return library_text
+
+    @cached_property
+    def _capacities(self):
+        """Seating capacity per library name, parsed once from the JSON."""
+        return {lib["name"]: self._parse_capacity(lib.get("capacity")) for lib in self.libraries}
+
+    @cached_property
+    def _hours_flags(self):
+        return [self._hours_bitmask(lib.get("hours")) for lib in self.libraries]
         
     def clear_screen(self):
         """Clear the terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if os.name == 'nt':
+            os.system('cls')
+        else:
+            sys.stdout.write(_CLEAR_SCREEN)
+            sys.stdout.flush()
         
     def print_header(self, title):
         """Print a formatted header."""
-        self.clear_screen()
-        print("=" * 60)
-        print(f"{title.center(60)}")
-        print("=" * 60)
-        print()
+        header = f"{'=' * 60}\n{title.center(60)}\n{'=' * 60}\n\n"
+        if os.name == 'nt':
+            self.clear_screen()
+        else:
+            header = _CLEAR_SCREEN + header
+        sys.stdout.write(header)
+        sys.stdout.flush()
         
     def get_selection(self, options, prompt="Select an option", allow_exit=True):
         """Get a valid selection from the user."""
@@ -42,20 +197,24 @@ class LibrarySystem:
                 print("\n0. Back to previous menu")
                 print("E. Exit program")
             
-            choice = input("\nEnter your choice: ").strip().lower()
-            
-            if choice == 'e':
+            sys.stdout.write("\nEnter your choice: ")
+            sys.stdout.flush()
+            line = sys.stdin.readline()
+            if not line:
+                self.exit_program()
+            choice = line.strip()
+
+            if choice in ('e', 'E'):
                 self.exit_program()
             
             if allow_exit and choice == '0':
                 return None
             
-            try:
+            # isdecimal() guarantees int() succeeds, so no exception on the normal path
+            if choice.isdecimal():
                 choice_index = int(choice) - 1
                 if 0 <= choice_index < len(options):
                     return options[choice_index]
-            except ValueError:
-                pass
                 
             print("\nInvalid selection. Please try again.")
     
@@ -64,20 +223,20 @@ class LibrarySystem:
         self.print_header(f"{library['name']} Information")
         
         if category == "All Information":
-            categories = ["Location", "Capacity", "Hours", "Special Notes", "URL", "Phone", "Email", "Features", "Specializations"]
+            categories = self.INFO_CATEGORIES
         elif category:
-            categories = [category]
+            categories = (category,)
         else:
             # Let user select a category
-            categories = ["Location", "Capacity", "Hours", "Special Notes", "URL", "Phone", "Email", "Features", "Specializations", "All Information"]
+            categories = self.INFO_CATEGORIES_WITH_ALL
             selected = self.get_selection(categories, "What information would you like to see?")
             if not selected:
                 return
             
             if selected == "All Information":
-                categories = ["Location", "Capacity", "Hours", "Special Notes", "URL", "Phone", "Email", "Features", "Specializations"]
+                categories = self.INFO_CATEGORIES
             else:
-                categories = [selected]
+                categories = (selected,)
         
         for category in categories:
             print(f"\n{category}:")
@@ -101,16 +260,13 @@ class LibrarySystem:
         while True:
             self.print_header("Library Information")
             
-            # Get library names
-            library_names = [lib["name"] for lib in self.libraries]
-            
             # Let user select a library
-            selected_library_name = self.get_selection(library_names, "Select a library for more information")
+            selected_library_name = self.get_selection(self.library_names, "Select a library for more information")
             if not selected_library_name:
                 return
                 
             # Find the selected library
-            selected_library = next((lib for lib in self.libraries if lib["name"] == selected_library_name), None)
+            selected_library = self._libraries_by_name.get(selected_library_name)
             
             if selected_library:
                 self.display_library_info(selected_library)
@@ -145,50 +301,53 @@ class LibrarySystem:
         
     def calculate_library_scores(self, preferences):
         """Calculate scores for each library based on user preferences."""
+        answers = (
+            preferences.get('purpose', ''),
+            preferences.get('subject', ''),
+            preferences.get('features', ''),
+            preferences.get('time', ''),
+        )
+        ranked = self._score_cache.get(answers)
+        if ranked is None:
+            ranked = self._score_cache[answers] = self._score_libraries(*answers)
+        scores = {name: score for name, score, _ in ranked}
+        reasons = {name: list(lib_reasons) for name, _, lib_reasons in ranked}
+        return scores, reasons
+
+    def _score_libraries(self, purpose, subject, desired_features, visit_time):
+        """Score every library for one set of answers.
+
+        Returns a tuple of (name, score, reasons) entries so cached results
+        cannot be mutated by callers.
+        """
         scores = {lib["name"]: 0 for lib in self.libraries}
         reasons = {lib["name"]: [] for lib in self.libraries}
         
-        purpose = preferences.get('purpose', '')
-        subject = preferences.get('subject', '')
-        desired_features = preferences.get('features', '')
-        visit_time = preferences.get('time', '')
-        
-        # Define purpose keywords mapping
-        purpose_keywords = {
-            "General study": ["study spaces", "quiet study", "study areas"],
-            "Research": ["research assistance", "special collections", "reference"],
-            "Group project": ["group study", "collaboration", "group spaces"],
-            "Access special collections": ["rare books", "archives", "special collections"],
-            "Use specialized equipment": ["makerspace", "equipment", "computers", "technology"],
-            "Quiet reading": ["quiet", "reading", "quiet areas"]
-        }
-        
-        # Define subject keywords mapping
-        subject_keywords = {
-            "General/Humanities": ["general", "humanities", "history", "literature", "philosophy"],
-            "Science/Technology/Engineering/Math": ["science", "technology", "engineering", "mathematics", "stem"],
-            "Health Sciences/Medicine": ["health", "medical", "medicine", "nursing", "pharmacy"],
-            "Law": ["law", "legal", "government"],
-            "Architecture/Fine Arts": ["architecture", "fine arts", "design", "art", "visual"],
-            "Education": ["education", "teaching", "learning", "educational"]
-        }
+        feature_code = _FEATURE_CODES.get(desired_features, -1)
+        time_code = _TIME_CODES.get(visit_time, -1)
+        purpose_rule = _PURPOSE_FEATURE_RULES.get(purpose)
+        feature_rule = _FEATURE_RULES.get(feature_code)
+        
+        # Keyword alternations for this run, each checked in a single regex pass
+        purpose_pattern = _PURPOSE_PATTERNS.get(purpose)
+        subject_pattern = _SUBJECT_PATTERNS.get(subject)
+        subject_terms_pattern = _keyword_pattern(subject.lower().split("/"))
         
         # Score each library
-        for library in self.libraries:
+        for index, library in enumerate(self.libraries):
             # Score based on subject specialization (weight: 0-5 points)
-            specializations = " ".join(library.get("specializations", [])).lower()
+            specializations, features_text, features_lower = self._library_text[index]
             features_list = library.get("features", [])
-            features_text = " ".join(features_list).lower()
             
             # 1. Subject matching (0-5 points)
             subject_match_score = 0
             
             # Direct subject match with specializations
-            if any(keyword in specializations for keyword in subject_keywords.get(subject, [])):
+            if subject_pattern and subject_pattern.search(specializations):
                 subject_match_score = 5
                 reasons[library["name"]].append(f"Specializes in {subject}")
             # Partial match with specializations
-            elif any(subj_term in specializations for subj_term in subject.lower().split("/")):
+            elif subject_terms_pattern.search(specializations):
                 subject_match_score = 3
                 reasons[library["name"]].append(f"Has relevant resources for {subject}")
             
@@ -196,21 +355,14 @@ class LibrarySystem:
             
             # 2. Purpose matching (0-3 points)
             purpose_match_score = 0
-            purpose_keywords_list = purpose_keywords.get(purpose, [])
             
-            if any(keyword in features_text for keyword in purpose_keywords_list):
+            if purpose_pattern and purpose_pattern.search(features_text):
                 purpose_match_score = 3
                 reasons[library["name"]].append(f"Excellent for {purpose.lower()}")
             # Check special cases
-            elif purpose == "Research" and "research assistance" in features_list:
-                purpose_match_score = 3
-                reasons[library["name"]].append("Provides research assistance")
-            elif purpose == "Group project" and "group study rooms" in features_list:
+            elif purpose_rule and purpose_rule[0] in features_list:
                 purpose_match_score = 3
-                reasons[library["name"]].append("Has group study rooms")
-            elif purpose == "Quiet reading" and "quiet study areas" in features_list:
-                purpose_match_score = 3
-                reasons[library["name"]].append("Has quiet study areas")
+                reasons[library["name"]].append(purpose_rule[1])
             
             scores[library["name"]] += purpose_match_score
             
@@ -218,22 +370,13 @@ class LibrarySystem:
             feature_match_score = 0
             
             # Direct match with the desired feature
-            if desired_features == "Group study spaces" and "group study rooms" in features_list:
-                feature_match_score = 4
-                reasons[library["name"]].append("Has dedicated group study rooms")
-            elif desired_features == "Quiet study areas" and "quiet study areas" in features_list:
+            if feature_rule and feature_rule[0] in features_list:
                 feature_match_score = 4
-                reasons[library["name"]].append("Has designated quiet study areas")
-            elif desired_features == "Special collections access" and any("special collections" in feature.lower() for feature in features_list):
+                reasons[library["name"]].append(feature_rule[1])
+            elif feature_code == FEATURE_SPECIAL_COLLECTIONS and any("special collections" in feature for feature in features_lower):
                 feature_match_score = 4
                 reasons[library["name"]].append("Provides access to special collections")
-            elif desired_features == "Computers and technology" and "computers" in features_list:
-                feature_match_score = 4
-                reasons[library["name"]].append("Offers computer and technology resources")
-            elif desired_features == "Research assistance" and "research assistance" in features_list:
-                feature_match_score = 4
-                reasons[library["name"]].append("Provides dedicated research assistance")
-            elif desired_features == "Large capacity" and library.get("capacity") and self._is_large_capacity(library.get("capacity")):
+            elif feature_code == FEATURE_LARGE_CAPACITY and self._capacities[library["name"]] > 1000:
                 feature_match_score = 4
                 reasons[library["name"]].append("Has large seating capacity")
             
@@ -241,18 +384,18 @@ class LibrarySystem:
             
             # 4. Time availability matching (0-2 points)
             time_match_score = 0
-            hours = library.get("hours", "").lower()
+            hours_flags = self._hours_flags[index]
             
-            if visit_time == "Late night (after 10pm)" and ("2am" in hours or "24" in hours):
+            if time_code == TIME_LATE_NIGHT and hours_flags & HOURS_LATE:
                 time_match_score = 2
                 reasons[library["name"]].append("Open late at night")
-            elif visit_time == "Weekend" and any(day in hours for day in ["sat", "sun", "weekend"]):
+            elif time_code == TIME_WEEKEND and hours_flags & HOURS_WEEKEND:
                 time_match_score = 2
                 reasons[library["name"]].append("Open on weekends")
-            elif visit_time == "Weekday daytime":
+            elif time_code == TIME_WEEKDAY_DAYTIME:
                 # Most libraries are open weekdays, so everyone gets this
                 time_match_score = 1
-            elif visit_time == "Weekday evening (after 5pm)" and any(term in hours for term in ["10pm", "evening", "night"]):
+            elif time_code == TIME_WEEKDAY_EVENING and hours_flags & HOURS_EVENING:
                 time_match_score = 2
                 reasons[library["name"]].append("Open during evening hours")
             
@@ -275,27 +418,27 @@ class LibrarySystem:
                 scores[library["name"]] += 1
                 reasons[library["name"]].append("Specializes in legal resources")
         
-        return scores, reasons
+        return tuple((name, score, tuple(reasons[name])) for name, score in scores.items())
     
-    def _is_large_capacity(self, capacity):
-        """Determine if a library has large capacity."""
-        if capacity is None:
-            return False
-            
+    def _hours_bitmask(self, hours):
+        """Classify a library's hours text into HOURS_* bit flags."""
+        flags = 0
+        for match in _HOURS_RE.finditer(hours or ""):
+            flags |= _HOURS_BIT[match.group(1).lower()]
+        return flags
+    
+    def _parse_capacity(self, capacity):
+        """Parse a library capacity (int or text such as "1,564") into an int."""
         # If it's already a number, use it directly
         if isinstance(capacity, int):
-            return capacity > 1000
+            return capacity
             
-        # Try to extract a number from a string
-        try:
-            if isinstance(capacity, str):
-                # Extract digits
-                digits = ''.join(filter(str.isdigit, capacity))
-                if digits:
-                    return int(digits) > 1000
-            return False
-        except:
-            return False
+        # Extract the digits from a string
+        if isinstance(capacity, str):
+            digits = "".join(_DIGITS_RE.findall(capacity))
+            if digits:
+                return int(digits)
+        return 0
         
     def get_best_library_match(self, scores, reasons):
         """Find the best library match based on scores."""
@@ -311,18 +454,7 @@ class LibrarySystem:
         
         # If still tied, prefer libraries with higher capacity
         if len(best_matches) > 1:
-            capacities = {}
-            for lib_name in best_matches:
-                library = next((lib for lib in self.libraries if lib["name"] == lib_name), None)
-                capacity = library.get("capacity")
-                
-                # Handle various capacity formats
-                if isinstance(capacity, int):
-                    capacities[lib_name] = capacity
-                elif isinstance(capacity, str) and capacity.isdigit():
-                    capacities[lib_name] = int(capacity)
-                else:
-                    capacities[lib_name] = 0
+            capacities = {lib_name: self._capacities[lib_name] for lib_name in best_matches}
             
             if any(capacities.values()):  # If we have any capacity data
                 best_match = max(capacities.items(), key=lambda x: x[1])[0]
@@ -334,60 +466,70 @@ class LibrarySystem:
             
         return best_match
         
+    def _flush(self, text):
+        """Write a fully formatted page to stdout with a single write."""
+        if sys.stdout.isatty():
+            sys.stdout.flush()
+            # os.write may write only part of the buffer; keep going until it's all out
+            data = memoryview(text.encode("utf-8"))
+            while data:
+                data = data[os.write(sys.stdout.fileno(), data):]
+        else:
+            sys.stdout.write(text)
+        
     def display_library_recommendation(self, best_match, preferences, scores, reasons):
         """Display the library recommendation with reasoning."""
         self.print_header("Library Recommendation")
         
         # Get the library details
-        library = next((lib for lib in self.libraries if lib["name"] == best_match), None)
+        library = self._libraries_by_name.get(best_match)
         
         if not library:
             print("Sorry, I couldn't find a matching library.")
             input("\nPress Enter to continue...")
             return
             
-        # Format and display the recommendation
-        print(f"Based on your preferences, I recommend **{best_match}**.\n")
+        # Format the whole recommendation page and write it out in one go
+        lines = [f"Based on your preferences, I recommend **{best_match}**.", ""]
         
-        print("Analysis of your preferences:")
-        print(f"- Purpose: {preferences.get('purpose', 'Not specified')}")
-        print(f"- Subject: {preferences.get('subject', 'Not specified')}")
-        print(f"- Desired Features: {preferences.get('features', 'Not specified')}")
-        print(f"- Visit Time: {preferences.get('time', 'Not specified')}\n")
+        lines.append("Analysis of your preferences:")
+        lines.append(f"- Purpose: {preferences.get('purpose', 'Not specified')}")
+        lines.append(f"- Subject: {preferences.get('subject', 'Not specified')}")
+        lines.append(f"- Desired Features: {preferences.get('features', 'Not specified')}")
+        lines.append(f"- Visit Time: {preferences.get('time', 'Not specified')}")
+        lines.append("")
         
-        print(f"Match Score: {scores[best_match]}/14")
+        lines.append(f"Match Score: {scores[best_match]}/14")
         
-        print("\nWhy this is a good match:")
+        lines.append("\nWhy this is a good match:")
         # Include the top 3 reasons (or all if fewer than 3)
         top_reasons = reasons[best_match][:3]
         for reason in top_reasons:
-            print(f"- {reason}")
+            lines.append(f"- {reason}")
         
-        print(f"\nAbout {best_match}:")
-        print(f"- Location: {library.get('location', 'Not specified')}")
-        print(f"- Hours: {library.get('hours', 'Not specified')}")
+        lines.append(f"\nAbout {best_match}:")
+        lines.append(f"- Location: {library.get('location', 'Not specified')}")
+        lines.append(f"- Hours: {library.get('hours', 'Not specified')}")
         
         # Add specializations
         specializations = library.get("specializations", [])
         if specializations:
-            print(f"- Specializes in: {', '.join(specializations[:3])}", end="")
+            line = f"- Specializes in: {', '.join(specializations[:3])}"
             if len(specializations) > 3:
-                print(f" and {len(specializations) - 3} more areas")
-            else:
-                print()
+                line += f" and {len(specializations) - 3} more areas"
+            lines.append(line)
         
         # Add features
         features_list = library.get("features", [])
         if features_list:
-            print(f"- Features: {', '.join(features_list[:3])}", end="")
+            line = f"- Features: {', '.join(features_list[:3])}"
             if len(features_list) > 3:
-                print(f" and {len(features_list) - 3} more")
-            else:
-                print()
+                line += f" and {len(features_list) - 3} more"
+            lines.append(line)
             
         # Special notes for time preference
         if preferences.get('time') == "Late night (after 10pm)" and "Library West" in best_match:
-            print("\nSpecial Note: For late night access to Library West, you'll need an active UF ID or Santa Fe College ID.")
+            lines.append("\nSpecial Note: For late night access to Library West, you'll need an active UF ID or Santa Fe College ID.")
         
         # Find second best match for alternative
         second_best = None
@@ -398,9 +540,11 @@ class LibrarySystem:
                 break
                 
         if second_best:
-            print(f"\nAlternative Option:")
-            print(f"If {best_match} doesn't work for you, consider {second_best} as an alternative.")
-            print(f"(Match score: {scores[second_best]}/14)")
+            lines.append(f"\nAlternative Option:")
+            lines.append(f"If {best_match} doesn't work for you, consider {second_best} as an alternative.")
+            lines.append(f"(Match score: {scores[second_best]}/14)")
+        
+        self._flush("\n".join(lines) + "\n")
             
         input("\nPress Enter to continue...")
     
@@ -435,11 +579,15 @@ class LibrarySystem:
         except KeyboardInterrupt:
             self.exit_program()
 
-if __name__ == "__main__":
+def main():
     # Get the path to the script directory
     script_dir = os.path.dirname(os.path.abspath(__file__))
     json_file = os.path.join(script_dir, "jsonfiles/lib.json")
     
     # Initialize and run the system
     system = LibrarySystem(json_file)
-    system.run()
\ No newline at end of file
+    system.run()
+
+
+if __name__ == "__main__":
+    main()
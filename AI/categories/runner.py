@@ -1,15 +1,15 @@
-import subprocess
+import importlib
 import sys
 
 def main():
-    # Mapping of menu options to script filenames
+    # Mapping of menu options to module names (imported on first use)
     menu_options = {
-        "1": ("Tuition Calculator", "tuition.py"),
-        "2": ("Clubs Information", "clubs.py"),
-        "3": ("Housing Details", "housing.py"),
-        "4": ("Course Catalog", "courses.py"),
-        "5": ("Library Services", "library.py"),
-        "6": ("Upcoming Events", "events.py"),
+        "1": ("Tuition Calculator", "tuition"),
+        "2": ("Clubs Information", "clubs"),
+        "3": ("Housing Details", "housing"),
+        "4": ("Course Catalog", "courses"),
+        "5": ("Library Services", "library"),
+        "6": ("Upcoming Events", "events"),
         "0": ("Exit", None)
     }
 
@@ -23,16 +23,23 @@ def main():
         choice = input("Enter the number of your choice: ").strip()
 
         if choice in menu_options:
-            description, script = menu_options[choice]
-            if script:
+            description, module_name = menu_options[choice]
+            if module_name:
                 print(f"\nLaunching {description}...\n")
                 try:
-                    # Execute the selected script
-                    subprocess.run(["python3", script], check=True)
-                except subprocess.CalledProcessError as e:
-                    print(f"An error occurred while running {script}: {e}")
-                except FileNotFoundError:
-                    print(f"Script {script} not found. Please ensure it exists in the current directory.")
+                    # Run the selected module in this interpreter instead of spawning a new one
+                    importlib.import_module(module_name).main()
+                except SystemExit as e:
+                    # The modules exit when the user leaves them; return to this menu instead
+                    if e.code not in (None, 0):
+                        print(f"An error occurred while running {module_name}.py: exit status {e.code}")
+                except Exception as e:
+                    # Only the selected module itself missing is "not found"; import errors
+                    # raised inside it (e.g. a missing dependency) keep their real message
+                    if isinstance(e, ModuleNotFoundError) and e.name == module_name:
+                        print(f"Module {module_name} not found. Please ensure {module_name}.py exists in the current directory.")
+                    else:
+                        print(f"An error occurred while running {module_name}.py: {e}")
             else:
                 print("Exiting the menu. Goodbye!")
                 sys.exit(0)
@@ -7,6 +7,22 @@ class TuitionCalculator:
     def __init__(self, json_data):
         """Initialize the tuition calculator with JSON data"""
         self.data = json_data
+        self._index_options(self.data["root"])
+    
+    @staticmethod
+    def _index_options(root):
+        """Attach a label -> option lookup to every question node in the tree."""
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if "options" not in node:
+                continue
+            # The first option with a given label wins, as the linear scan did
+            by_label = {}
+            for option in node["options"]:
+                by_label.setdefault(option["label"], option)
+            node["_by_label"] = by_label
+            stack.extend(option["next"] for option in node["options"] if "next" in option)
         
     def clear_screen(self):
         """Clear the terminal screen."""
@@ -22,14 +38,16 @@ class TuitionCalculator:
         
     def get_selection(self, options, prompt="Select an option", allow_exit=True):
         """Get a valid selection from the user."""
+        # Render the whole option block once and write it in a single call per attempt
+        lines = [f"\n{prompt}:"]
+        lines.extend(f"{i}. {option}" for i, option in enumerate(options, 1))
+        if allow_exit:
+            lines.append("\n0. Back to previous menu")
+            lines.append("E. Exit program")
+        menu = "\n".join(lines) + "\n"
+        
         while True:
-            print(f"\n{prompt}:")
-            for i, option in enumerate(options, 1):
-                print(f"{i}. {option}")
-            
-            if allow_exit:
-                print("\n0. Back to previous menu")
-                print("E. Exit program")
+            sys.stdout.write(menu)
             
             choice = input("\nEnter your choice: ").strip().lower()
             
@@ -39,12 +57,10 @@ class TuitionCalculator:
             if allow_exit and choice == '0':
                 return None
             
-            try:
+            if choice.isdecimal():
                 choice_index = int(choice) - 1
                 if 0 <= choice_index < len(options):
                     return options[choice_index]
-            except ValueError:
-                pass
                 
             print("\nInvalid selection. Please try again.")
     
@@ -77,27 +93,29 @@ class TuitionCalculator:
     
     def navigate_decision_tree(self, node):
         """Navigate through the decision tree based on user selections."""
-        # If we've reached a result node, display it
-        if "result" in node:
-            self.display_tuition_results(node["result"])
-            return
-        
-        # Otherwise, ask the current question
-        question = node["question"]
-        options = [option["label"] for option in node["options"]]
-        
-        selected = self.get_selection(options, question)
-        if not selected:
-            return
-        
-        # Find the selected option and navigate to the next node
-        for option in node["options"]:
-            if option["label"] == selected:
-                if "next" in option:
-                    self.navigate_decision_tree(option["next"])
-                elif "result" in option:
+        # Walk down the tree one node at a time rather than recursing per level
+        while True:
+            # If we've reached a result node, display it
+            if "result" in node:
+                self.display_tuition_results(node["result"])
+                return
+            
+            # Otherwise, ask the current question
+            question = node["question"]
+            options = [option["label"] for option in node["options"]]
+            
+            selected = self.get_selection(options, question)
+            if not selected:
+                return
+            
+            # Find the selected option and move on to the next node
+            option = node["_by_label"][selected]
+            if "next" in option:
+                node = option["next"]
+            else:
+                if "result" in option:
                     self.display_tuition_results(option["result"])
-                break
+                return
     
     def main_menu(self):
         """Display the main menu."""
@@ -163,11 +181,15 @@ def load_json_data(json_string):
         sys.exit(1)
 
 
-if __name__ == "__main__":
+def main():
     # You can either load from a file or use the embedded JSON data
     # Option 1: Load from a file
     with open("./jsonFiles/tuition.json", "r") as f:
         json_data = json.load(f)
     
     calculator = TuitionCalculator(json_data)
-    calculator.run()
\ No newline at end of file
+    calculator.run()
+
+
+if __name__ == "__main__":
+    main()
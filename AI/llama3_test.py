@@ -1,36 +1,89 @@
 import os
+import sys
 import json
-import pickle
 import numpy as np
 import requests
 import re
-import time
-from collections import deque
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from bs4 import BeautifulSoup
 from llama_cpp import Llama
 from sentence_transformers import SentenceTransformer
 
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+CONTENT_CLASS_RE = re.compile(r'content|main')
+
 
 class LLaMA3Assistant:
+    PROMPT_PREFIX = """
+You are a knowledgeable and helpful assistant for the University of Florida. Answer the following question clearly, accurately, and directly. If the context doesn't help, suggest where the user might look (like the campus map, registrar, or student affairs).
+
+Context:
+"""
+    MAX_CONTEXT_TOKENS = 400
+    # Page chunks of CHUNK_SIZE characters, starting every CHUNK_STEP characters (200-character overlap)
+    CHUNK_SIZE = 800
+    CHUNK_STEP = 600
+    REQUEST_HEADERS = {'User-Agent': 'Mozilla/5.0'}
+    MAX_RESPONSE_TOKENS = 350
+    STOP_SEQUENCES = ["Question:", "\n\n"]
+    # Sampling temperature for both the in-process model and llama-server
+    TEMPERATURE = 0.3
+    # Most recent query embeddings kept per assistant
+    QUERY_CACHE_SIZE = 2048
+
     def __init__(self):
         self.MODEL_PATH = r"C:\Users\smhue\OneDrive\Documents\GitHub\GatorNet\AI\models\AI\Meta-Llama-3-8B-Instruct-Q4_K_M.gguf"
 
         if not os.path.exists(self.MODEL_PATH):
             raise FileNotFoundError(f"Model file not found at {self.MODEL_PATH}. Please download it from Hugging Face and place it in the 'models' folder.")
 
-        self.llm = Llama(
-            model_path=self.MODEL_PATH,
-            n_ctx=4096,
-            n_threads=8,
-            n_gpu_layers=32,
-            temperature=0.3,
-            verbose=False
-        )
+        # When LLAMA_SERVER_URL points at a llama-server started with --parallel N --cont-batching,
+        # generation goes over HTTP so concurrent queries are decoded together in one batch
+        self.SERVER_URL = os.environ.get("LLAMA_SERVER_URL", "").rstrip("/") or None
+        self._llm_lock = threading.Lock()
+
+        # Query -> embedding, least recently used first
+        self._query_embeddings = OrderedDict()
+        self._query_embeddings_lock = threading.Lock()
+
+        if self.SERVER_URL:
+            # Only the vocabulary is needed locally, for token-accurate context truncation
+            self.llm = Llama(model_path=self.MODEL_PATH, vocab_only=True, verbose=False)
+        else:
+            self.llm = Llama(
+                model_path=self.MODEL_PATH,
+                n_ctx=4096,
+                n_threads=8,
+                n_gpu_layers=32,
+                n_batch=512,
+                n_ubatch=512,
+                flash_attn=True,
+                offload_kqv=True,
+                temperature=self.TEMPERATURE,
+                verbose=False
+            )
+
+            self.cache_prompt_prefix()
 
         self.encoder = SentenceTransformer("all-MiniLM-L6-v2")
 
         self.BASE_DIR = os.path.dirname(os.path.abspath(__file__))
         self.CACHE_FILE = os.path.join(self.BASE_DIR, "uf_knowledge.cache")
+        self.TEXT_CACHE_FILE = self.CACHE_FILE + ".json"
+        self.EMBEDDING_CACHE_FILE = self.CACHE_FILE + ".npy"
         self.UF_BASE_URLS = [
             'https://campusmap.ufl.edu/',
             'https://housing.ufl.edu/living-options/apply/residence-halls/',
@@ -44,96 +97,249 @@ class LLaMA3Assistant:
             'https://news.ufl.edu/'
         ]
 
-        self.SCRAPE_DEPTH = 1
         self.MAX_PAGES = 20
 
-        self.knowledge_base = self.load_or_build_knowledge()
+        # One pooled session so scrapes reuse keep-alive TCP/TLS connections
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+        # Only the chunks are kept; the full page texts are dropped once they have been split
+        self.knowledge_chunks = self.chunk_knowledge(self.load_or_build_knowledge())
 
         with open(os.path.join(self.BASE_DIR, "static_knowledge.json"), "r") as f:
             self.STATIC_KNOWLEDGE = json.load(f)
 
-        self.embedding_cache = {}
         self.cache_static_embeddings()
+        self.cache_knowledge_embeddings()
+        self.build_context_matrix()
+        self.build_index()
+
+        # Retrieval reads _ctx_parts (or the index); drop the per-source references
+        del self._static_embs, self._ctx_embs
+
+    def cache_prompt_prefix(self):
+        # Evaluate the invariant system prompt once and keep its KV state for reuse
+        self.llm.reset()
+        self.llm.eval(self.llm.tokenize(self.PROMPT_PREFIX.encode("utf-8")))
+        self._prefix_state = self.llm.save_state()
+
+    def chunk_knowledge(self, pages):
+        # Overlapping windows over each page body, each tagged with the page's source line
+        chunks = []
+        for page in pages:
+            source, _, body = page.partition("\n")
+            for start in range(0, max(len(body), 1), self.CHUNK_STEP):
+                chunks.append(f"{source}\n{body[start:start + self.CHUNK_SIZE]}")
+                if start + self.CHUNK_SIZE >= len(body):
+                    break
+        return chunks
+
+    def encode_batch(self, texts, batch_size=32):
+        # One encode call for all texts so the model runs full batches
+        return self.encoder.encode(
+            texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
 
     def cache_static_embeddings(self):
-        for category, data in self.STATIC_KNOWLEDGE.items():
-            text = json.dumps(data)
-            self.embedding_cache[f"static_{category}"] = self.encoder.encode([text])[0]
+        # Serialize each category once; the texts are reused as retrieval results
+        self._static_texts = {category: json.dumps(data) for category, data in self.STATIC_KNOWLEDGE.items()}
+        texts = list(self._static_texts.values())
+        # Embeddings in STATIC_KNOWLEDGE order
+        self._static_embs = self.encode_batch(texts) if texts else []
+
+    def cache_knowledge_embeddings(self):
+        # _ctx_embs[i] is the embedding of knowledge_chunks[i], memory-mapped from disk when cached
+        if os.path.exists(self.EMBEDDING_CACHE_FILE):
+            embeddings = np.load(self.EMBEDDING_CACHE_FILE, mmap_mode='r')
+            if len(embeddings) == len(self.knowledge_chunks):
+                self._ctx_embs = embeddings
+                return
+        self._ctx_embs = self.encode_batch(self.knowledge_chunks, batch_size=64) if self.knowledge_chunks else []
+        if len(self._ctx_embs):
+            np.save(self.EMBEDDING_CACHE_FILE, self._ctx_embs)
+
+    def _encode_query(self, query):
+        with self._query_embeddings_lock:
+            if query in self._query_embeddings:
+                self._query_embeddings.move_to_end(query)
+                return self._query_embeddings[query]
+
+        embedding = self.encode_batch([query])[0]
+        with self._query_embeddings_lock:
+            self._query_embeddings[query] = embedding
+            if len(self._query_embeddings) > self.QUERY_CACHE_SIZE:
+                self._query_embeddings.popitem(last=False)
+        return embedding
+
+    def build_context_matrix(self):
+        # Retrieval scores each part with one matrix-vector product. encode_batch returns unit-length
+        # float32 rows, so the parts are used as they are and the cached knowledge embeddings stay
+        # memory-mapped instead of being copied into RAM
+        self._ctx_texts = list(self._static_texts.values()) + list(self.knowledge_chunks)
+        self._ctx_parts = [np.asarray(emb) for emb in (self._static_embs, self._ctx_embs) if len(emb)]
+
+    def build_index(self):
+        # Inner-product index storing 8-bit codes per dimension (4x smaller than float32);
+        # falls back to numpy when faiss is missing
+        self.index = None
+        if faiss is not None and self._ctx_parts:
+            self.index = faiss.IndexScalarQuantizer(
+                self._ctx_parts[0].shape[1],
+                faiss.ScalarQuantizer.QT_8bit,
+                faiss.METRIC_INNER_PRODUCT
+            )
+            # The quantizer needs every row for its value ranges; the stacked copy is dropped right after
+            matrix = np.ascontiguousarray(np.vstack(self._ctx_parts), dtype=np.float32)
+            self.index.train(matrix)
+            self.index.add(matrix)
+            # The index holds its own codes, so the float matrices are no longer needed
+            self._ctx_parts = []
 
     def safe_scrape(self, url):
         try:
-            time.sleep(0.5)
-            headers = {'User-Agent': 'Mozilla/5.0'}
-            response = requests.get(url, headers=headers, timeout=10)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            response = self._session.get(url, headers=self.REQUEST_HEADERS, timeout=10)
+            soup = BeautifulSoup(response.content, HTML_PARSER)
 
             for element in soup(['script', 'style', 'nav', 'footer', 'header']):
                 element.decompose()
 
-            main_content = soup.find('main') or soup.find('article') or soup.find('div', class_=re.compile(r'content|main'))
+            main_content = soup.find('main') or soup.find('article') or soup.find('div', class_=CONTENT_CLASS_RE)
             text = main_content.get_text(separator=' ', strip=True) if main_content else soup.get_text(separator=' ', strip=True)
-            text = re.sub(r'\s+', ' ', text)
+            text = ' '.join(text.split())
             return f"[Source: {url}]\n{text[:3000]}"
         except Exception:
             return None
 
     def load_or_build_knowledge(self):
-        if os.path.exists(self.CACHE_FILE):
-            with open(self.CACHE_FILE, "rb") as f:
-                return pickle.load(f)
-
-        knowledge = []
-        visited = set()
-        for base_url in self.UF_BASE_URLS:
-            queue = deque([(base_url, 0)])
-            while queue and len(knowledge) < self.MAX_PAGES:
-                url, depth = queue.popleft()
-                if url in visited or depth > self.SCRAPE_DEPTH:
-                    continue
-                visited.add(url)
-                content = self.safe_scrape(url)
-                if content:
-                    knowledge.append(content)
-        with open(self.CACHE_FILE, "wb") as f:
-            pickle.dump(knowledge, f)
+        if os.path.exists(self.TEXT_CACHE_FILE):
+            with open(self.TEXT_CACHE_FILE, "r") as f:
+                return json.load(f)
+
+        # Scraping is network-bound, so fetch the (deduplicated) base URLs concurrently
+        urls = list(dict.fromkeys(self.UF_BASE_URLS))
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(self.safe_scrape, urls))
+        knowledge = [content for content in results if content][:self.MAX_PAGES]
+        with open(self.TEXT_CACHE_FILE, "w") as f:
+            json.dump(knowledge, f)
+        # Embeddings cached for a previous scrape no longer line up with the new texts
+        if os.path.exists(self.EMBEDDING_CACHE_FILE):
+            os.remove(self.EMBEDDING_CACHE_FILE)
         return knowledge
 
     def get_relevant_context(self, query, k=4):
-        if query not in self.embedding_cache:
-            self.embedding_cache[query] = self.encoder.encode([query])[0]
-        query_embedding = self.embedding_cache[query]
+        query_embedding = self._encode_query(query)
 
-        contexts = []
-        for category, data in self.STATIC_KNOWLEDGE.items():
-            key = f"static_{category}"
-            similarity = np.dot(query_embedding, self.embedding_cache[key])
-            contexts.append((similarity, json.dumps(data)))
+        if self.index is not None:
+            query_matrix = np.ascontiguousarray(query_embedding.reshape(1, -1), dtype=np.float32)
+            _, indices = self.index.search(query_matrix, min(k, self.index.ntotal))
+            return "\n".join(self._ctx_texts[i] for i in indices[0] if i != -1)
 
-        for text in self.knowledge_base:
-            if text not in self.embedding_cache:
-                self.embedding_cache[text] = self.encoder.encode([text])[0]
-            similarity = np.dot(query_embedding, self.embedding_cache[text])
-            contexts.append((similarity, text))
+        if not self._ctx_parts:
+            return ""
+        similarities = np.concatenate([part @ query_embedding for part in self._ctx_parts])
+        k = min(k, len(similarities))
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(-similarities[top])]
+        return "\n".join(self._ctx_texts[i] for i in top)
 
-        contexts.sort(reverse=True)
-        return "\n".join(text for _, text in contexts[:k])
+    def truncate_to_tokens(self, text, max_tokens):
+        # Cut on a token boundary so the budget matches what the model actually sees
+        tokens = self.llm.tokenize(text.encode("utf-8"), add_bos=False)
+        if len(tokens) <= max_tokens:
+            return text
+        return self.llm.detokenize(tokens[:max_tokens]).decode("utf-8", errors="ignore")
 
-    def generate_response(self, query):
+    def stream_response(self, query):
+        # Yield completion text as llama.cpp decodes it so callers can show the first tokens right away
         context = self.get_relevant_context(query)
 
-        prompt = f"""
-You are a knowledgeable and helpful assistant for the University of Florida. Answer the following question clearly, accurately, and directly. If the context doesn't help, suggest where the user might look (like the campus map, registrar, or student affairs).
-
-Context:
-{context[:1500]}
+        prompt = self.PROMPT_PREFIX + f"""{self.truncate_to_tokens(context, self.MAX_CONTEXT_TOKENS)}
 
 Question: {query}
 
 Answer:
 """
 
-        result = self.llm(prompt, max_tokens=350, stop=["Question:", "\n\n"], echo=False)
-        return result["choices"][0]["text"].strip()
+        completion = self._server_completion(prompt) if self.SERVER_URL else self._local_completion(prompt)
+        started = False
+        for text in completion:
+            if not started:
+                text = text.lstrip()
+                started = bool(text)
+            if text:
+                yield text
+
+    def _local_completion(self, prompt):
+        # The in-process model has a single context, so concurrent callers take turns. A worker
+        # decodes under the lock into a queue that fits a whole response, so the lock is never
+        # held while the caller runs and is released even if the caller stops reading
+        # (one chunk per token, plus a final chunk, an error and the end marker)
+        chunks = queue.Queue(maxsize=self.MAX_RESPONSE_TOKENS + 3)
+        cancelled = threading.Event()
+
+        def decode():
+            try:
+                with self._llm_lock:
+                    # Restore the KV state for the shared prefix so only the query-specific tail is prefilled
+                    self.llm.load_state(self._prefix_state)
+                    for chunk in self.llm(prompt, max_tokens=self.MAX_RESPONSE_TOKENS, stop=self.STOP_SEQUENCES,
+                                          temperature=self.TEMPERATURE, echo=False, stream=True):
+                        if cancelled.is_set():
+                            break
+                        chunks.put(chunk["choices"][0]["text"])
+            except Exception as e:
+                chunks.put(e)
+            finally:
+                chunks.put(None)
+
+        threading.Thread(target=decode, daemon=True).start()
+        try:
+            while (item := chunks.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            cancelled.set()
+
+    def _server_completion(self, prompt):
+        # llama-server batches in-flight requests itself; cache_prompt reuses the shared prefix per slot
+        payload = {
+            "prompt": prompt,
+            "n_predict": self.MAX_RESPONSE_TOKENS,
+            "stop": self.STOP_SEQUENCES,
+            "temperature": self.TEMPERATURE,
+            "cache_prompt": True,
+            "stream": True
+        }
+        with self._session.post(f"{self.SERVER_URL}/completion", json=payload, stream=True, timeout=120) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line.startswith(b"data: "):
+                    continue
+                event = json.loads(line[len(b"data: "):])
+                yield event.get("content", "")
+                if event.get("stop"):
+                    break
+
+    def print_response(self, query):
+        # Write tokens to stdout as they arrive and return the full answer
+        pieces = []
+        for text in self.stream_response(query):
+            sys.stdout.write(text)
+            sys.stdout.flush()
+            pieces.append(text)
+        sys.stdout.write("\n")
+        return "".join(pieces).strip()
+
+    def generate_response(self, query):
+        return "".join(self.stream_response(query)).strip()
 
 
 if __name__ == "__main__":
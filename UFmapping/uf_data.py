@@ -1,108 +1,175 @@
 import requests
 import json
 import os
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+def count_elements(path):
+    """Count the Overpass elements in a saved file (raises if it isn't valid JSON).
+    Streams the file when ijson is installed instead of loading it into memory."""
+    with open(path, "rb") as f:
+        if ijson is not None:
+            return sum(1 for _ in ijson.items(f, "elements.item"))
+        return len(json.load(f).get("elements", []))
+
+# More precise bounding box for UF main campus
+BBOX = "29.635,-82.365,29.655,-82.335"
+
+# Overpass API endpoint
+OVERPASS_URL = "https://overpass-api.de/api/interpreter"
+
+# More focused queries, as written (see QUERIES for what is sent)
+_RAW_QUERIES = [
+    # UF Campus Buildings
+    {
+        "name": "uf_buildings.json",
+        "query": f"""
+        [out:json];
+        (
+          way["building"]["operator"="University of Florida"]({BBOX});
+          way["building"]["name"*="University of Florida"]({BBOX});
+          way["building"]["name"*="UF "]({BBOX});
+        );
+        out body;
+        >;
+        out skel qt;
+        """
+    },
+    # All Buildings on Campus (for completeness)
+    {
+        "name": "campus_buildings.json",
+        "query": f"""
+        [out:json];
+        (
+          way["building"]({BBOX});
+        );
+        out body;
+        >;
+        out skel qt;
+        """
+    },
+    # Campus Amenities
+    {
+        "name": "campus_amenities.json",
+        "query": f"""
+        [out:json];
+        (
+          node["amenity"]({BBOX});
+          way["amenity"]({BBOX});
+        );
+        out body;
+        >;
+        out skel qt;
+        """
+    },
+    # Campus Facilities
+    {
+        "name": "campus_facilities.json",
+        "query": f"""
+        [out:json];
+        (
+          node["leisure"]({BBOX});
+          way["leisure"]({BBOX});
+          node["shop"]({BBOX});
+          way["shop"]({BBOX});
+        );
+        out body;
+        >;
+        out skel qt;
+        """
+    },
+    # Campus Roads and Paths
+    {
+        "name": "campus_roads.json",
+        "query": f"""
+        [out:json];
+        (
+          way["highway"]({BBOX});
+        );
+        out body;
+        >;
+        out skel qt;
+        """
+    }
+]
+
+# The queries as sent: whitespace collapsed once at import so every POST body is as small as possible
+QUERIES = tuple({"name": q["name"], "query": " ".join(q["query"].split())} for q in _RAW_QUERIES)
+
+# Validators from the last successful download of each file, sent back as conditional headers
+VALIDATORS_FILE = os.path.join("campus_data_osm", ".etags.json")
 
 def fetch_uf_campus_data():
     # Create directory for the data
     os.makedirs("campus_data_osm", exist_ok=True)
     
-    # More precise bounding box for UF main campus
-    bbox = "29.635,-82.365,29.655,-82.335"
-    
-    # Overpass API endpoint
-    overpass_url = "https://overpass-api.de/api/interpreter"
+    try:
+        with open(VALIDATORS_FILE, "r") as f:
+            validators = json.load(f)
+    except (OSError, ValueError):
+        validators = {}
     
-    # More focused queries
-    queries = [
-        # UF Campus Buildings
-        {
-            "name": "uf_buildings.json",
-            "query": f"""
-            [out:json];
-            (
-              way["building"]["operator"="University of Florida"]({bbox});
-              way["building"]["name"*="University of Florida"]({bbox});
-              way["building"]["name"*="UF "]({bbox});
-            );
-            out body;
-            >;
-            out skel qt;
-            """
-        },
-        # All Buildings on Campus (for completeness)
-        {
-            "name": "campus_buildings.json",
-            "query": f"""
-            [out:json];
-            (
-              way["building"]({bbox});
-            );
-            out body;
-            >;
-            out skel qt;
-            """
-        },
-        # Campus Amenities
-        {
-            "name": "campus_amenities.json",
-            "query": f"""
-            [out:json];
-            (
-              node["amenity"]({bbox});
-              way["amenity"]({bbox});
-            );
-            out body;
-            >;
-            out skel qt;
-            """
-        },
-        # Campus Facilities
-        {
-            "name": "campus_facilities.json",
-            "query": f"""
-            [out:json];
-            (
-              node["leisure"]({bbox});
-              way["leisure"]({bbox});
-              node["shop"]({bbox});
-              way["shop"]({bbox});
-            );
-            out body;
-            >;
-            out skel qt;
-            """
-        },
-        # Campus Roads and Paths
-        {
-            "name": "campus_roads.json",
-            "query": f"""
-            [out:json];
-            (
-              way["highway"]({bbox});
-            );
-            out body;
-            >;
-            out skel qt;
-            """
-        }
-    ]
+    # The queries are independent network round-trips, so run them concurrently
+    # over one shared session (kept small to respect Overpass fair use)
+    with requests.Session() as session:
+        # Keep-alive connections to the endpoint, retrying Overpass rate limits and gateway errors
+        # (queries are read-only, so retrying the POST is safe)
+        retry = Retry(total=3, backoff_factor=1, status_forcelist=[429, 502, 504],
+                      allowed_methods=frozenset({"POST"}), raise_on_status=False)
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=5, max_retries=retry))
+        
+        def fetch(query_info):
+            path = os.path.join("campus_data_osm", query_info['name'])
+            # Ask the server to skip the body if our copy is still current
+            headers = {}
+            saved = validators.get(query_info['name'], {}) if os.path.exists(path) else {}
+            if saved.get("etag"):
+                headers["If-None-Match"] = saved["etag"]
+            if saved.get("last_modified"):
+                headers["If-Modified-Since"] = saved["last_modified"]
+            try:
+                with session.post(OVERPASS_URL, data={"data": query_info['query']}, headers=headers,
+                                  stream=True, timeout=(10, 300)) as response:
+                    if response.status_code == 304:
+                        return f"✅ {query_info['name']} is unchanged"
+                    if response.status_code == 200:
+                        # Stream the body straight to disk instead of parsing and re-serializing it;
+                        # write to a temp file so a dropped connection can't truncate the old data
+                        with open(path + ".tmp", "wb") as f:
+                            for chunk in response.iter_content(chunk_size=64 * 1024):
+                                f.write(chunk)
+                        # Only replace the saved data with a body that parses
+                        # (Overpass reports some errors as an HTML page with status 200)
+                        try:
+                            count = count_elements(path + ".tmp")
+                        except Exception as e:
+                            os.remove(path + ".tmp")
+                            return f"❌ Invalid response for {query_info['name']}: {e}"
+                        os.replace(path + ".tmp", path)
+                        validators[query_info['name']] = {
+                            "etag": response.headers.get("ETag"),
+                            "last_modified": response.headers.get("Last-Modified")
+                        }
+                        return f"✅ Saved {count} elements to {query_info['name']}"
+                    return (f"❌ Failed to fetch {query_info['name']}: {response.status_code}\n"
+                            f"Response: {response.text[:200]}...")
+            except Exception as e:
+                return f"❌ Error fetching {query_info['name']}: {e}"
+        
+        for query_info in QUERIES:
+            print(f"Fetching {query_info['name']}...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for message in executor.map(fetch, QUERIES):
+                print(message)
     
-    # Fetch each query
-    for query_info in queries:
-        print(f"Fetching {query_info['name']}...")
-        try:
-            response = requests.post(overpass_url, data={"data": query_info['query']})
-            
-            if response.status_code == 200:
-                data = response.json()
-                with open(os.path.join("campus_data_osm", query_info['name']), "w") as f:
-                    json.dump(data, f, indent=2)
-                print(f"✅ Saved {len(data.get('elements', []))} elements to {query_info['name']}")
-            else:
-                print(f"❌ Failed to fetch {query_info['name']}: {response.status_code}")
-                print(f"Response: {response.text[:200]}...")
-        except Exception as e:
-            print(f"❌ Error fetching {query_info['name']}: {e}")
+    with open(VALIDATORS_FILE, "w") as f:
+        json.dump(validators, f, indent=2)
 
 if __name__ == "__main__":
     print("Fetching UF campus data from OpenStreetMap...")
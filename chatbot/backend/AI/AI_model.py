@@ -7,6 +7,7 @@ using LLaMA 3 with embedded knowledge and advanced retrieval techniques.
 """
 import csv
 import functools
+import operator
 import torch
 import difflib
 from loguru import logger
@@ -17,10 +18,21 @@ import os
 import re
 import json
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
+from types import MappingProxyType
+
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+except ImportError:
+    fuzz_process = None
+
+# CPU encodes use every core unless TORCH_NUM_THREADS says otherwise
+torch.set_num_threads(int(os.environ.get("TORCH_NUM_THREADS", os.cpu_count() or 1)))
 
 # ------------------------------
 # Setup Logging (using loguru)
@@ -69,6 +81,11 @@ else:
         print(f"Current directory contains: {os.listdir(current_dir)}")
 
 
+@functools.lru_cache(maxsize=None)
+def _dir_exists(path):
+    return os.path.isdir(path)
+
+
 # Function to verify data directories
 def verify_data_directories():
     required_dirs = [
@@ -81,23 +98,24 @@ def verify_data_directories():
     ]
 
     for directory in required_dirs:
-        if os.path.exists(directory):
-            print(f"✓ Found {directory}")
+        if _dir_exists(directory):
+            logger.debug(f"Found {directory}")
             # Check for some files
             try:
                 files = os.listdir(directory)
                 if files:
-                    print(f"  ✓ Contains {len(files)} files/directories")
+                    logger.debug(f"  Contains {len(files)} files/directories")
                 else:
-                    print(f"  ✗ Directory is empty")
+                    logger.debug(f"  Directory is empty")
             except Exception as e:
-                print(f"  ✗ Error listing directory: {e}")
+                logger.debug(f"  Error listing directory: {e}")
         else:
-            print(f"✗ Missing {directory}")
+            logger.debug(f"Missing {directory}")
 
 
-# Call this on module load
-verify_data_directories()
+# Scanning the data tree on every import slows worker start-up, so only do it on request
+if os.environ.get("AI_VERIFY_DIRS") == "1":
+    verify_data_directories()
 
 ACADEMIC_CALENDAR = {
     "terms": {
@@ -139,6 +157,9 @@ ACADEMIC_CALENDAR = {
         },
     },
 }
+# Shared by every request, so expose it read-only (the nested dicts stay plain
+# dicts because the response code type-checks them)
+ACADEMIC_CALENDAR = MappingProxyType(ACADEMIC_CALENDAR)
 
 # ------------------------------
 # Entity Aliases
@@ -198,29 +219,167 @@ DORM_ALIASES = {
 }
 
 
-# ------------------------------
-# Enhanced Major Search Functionality
-# ------------------------------
-def search_major_info(query, home_dir):
+def _freeze_aliases(aliases_dict):
+    """Read-only view of an aliases dict with interned names and tuple alias lists"""
+    return MappingProxyType(
+        {
+            sys.intern(canon): tuple(sys.intern(alias) for alias in aliases)
+            for canon, aliases in aliases_dict.items()
+        }
+    )
+
+
+LIBRARY_ALIASES = _freeze_aliases(LIBRARY_ALIASES)
+BUILDING_ALIASES = _freeze_aliases(BUILDING_ALIASES)
+DORM_ALIASES = _freeze_aliases(DORM_ALIASES)
+
+
+# Compiled alias matchers, keyed by id() of the aliases dict they were built from
+_ALIAS_MATCHERS = {}
+
+
+def _alias_matcher(aliases_dict):
     """
-    Search for information about an academic major/program
-    with improved detection and formatting
+    Compile an aliases dict into one alternation regex (longest alias first) and a
+    map from each alias to the canonical names it implies. An alias also implies the
+    canonical names of any aliases that are prefixes of it, since a lookahead scan
+    only reports the longest alias starting at each position.
     """
-    # Normalize query
-    query_lower = query.lower().strip()
-
-    # Extract major name with improved patterns
-    major_patterns = [
+    cached = _ALIAS_MATCHERS.get(id(aliases_dict))
+    if cached is not None and cached[0] is aliases_dict:
+        return cached[1], cached[2]
+
+    alias_to_canon = defaultdict(set)
+    for canon, aliases in aliases_dict.items():
+        for alias in aliases:
+            alias_to_canon[alias.lower()].add(canon)
+    implied = {
+        alias: set().union(
+            *(canons for other, canons in alias_to_canon.items() if alias.startswith(other))
+        )
+        for alias in alias_to_canon
+    }
+    pattern = re.compile(
+        "(?=("
+        + "|".join(map(re.escape, sorted(alias_to_canon, key=len, reverse=True)))
+        + "))"
+    )
+    _ALIAS_MATCHERS[id(aliases_dict)] = (aliases_dict, pattern, implied)
+    return pattern, implied
+
+
+def find_alias_mentions(query_lower, aliases_dict):
+    """Canonical names whose aliases appear anywhere in the (lowercased) query"""
+    pattern, implied = _alias_matcher(aliases_dict)
+    mentioned = set()
+    for match in pattern.finditer(query_lower):
+        mentioned |= implied[match.group(1)]
+    return mentioned
+
+
+# Major-name extraction patterns for search_major_info, tried in order
+_MAJOR_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in [
         r"major in\s+([a-zA-Z\s&]+)(?:\s|$|\.|\?)",
         r"studying\s+([a-zA-Z\s&]+)(?:\s|$|\.|\?)",
         r"about\s+([a-zA-Z\s&]+)\s+(?:major|program|degree)",
         r"([a-zA-Z\s&]+)\s+(?:major|program|degree)",
         r"information about\s+([a-zA-Z\s&]+)",
     ]
+)
+
+# Library hours: one pattern for every "hours range (day tag)" pair, and the days each tag covers
+_HOURS_RE = re.compile(
+    r"([\d:]+\s*[ap]m\s*-\s*[\d:]+\s*[ap]m)\s*\((Sun-Thu|Mon-Thu|Mon-Fri|Fri|Sat|Sun)\)"
+)
+_DAY_MAP = {
+    "Sun-Thu": ("Monday", "Tuesday", "Wednesday", "Thursday"),
+    "Mon-Thu": ("Monday", "Tuesday", "Wednesday", "Thursday"),
+    "Mon-Fri": ("Monday", "Tuesday", "Wednesday", "Thursday"),
+    "Fri": ("Friday",),
+    "Sat": ("Saturday",),
+    "Sun": ("Sunday",),
+}
+
+
+# ------------------------------
+# Enhanced Major Search Functionality
+# ------------------------------
+def _file_mtime(path):
+    """Modification time of path, or None if it can't be read"""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
 
+@functools.lru_cache(maxsize=8)
+def _load_major_search_index(programs_path, programs_mtime, majors_path, majors_mtime):
+    """
+    Load programs and major descriptions and index them for search_major_info.
+    Cached per file version, so the tables are built once rather than per query.
+
+    Returns (name_index, names_lower, department_index, department_names,
+    majors_descriptions): programs by lowercase name, (lowercase name, program)
+    pairs in file order, programs by lowercase department, the lowercase
+    department names as a tuple (for difflib), and descriptions by lowercase
+    department.
+    """
+    programs = []
+    try:
+        header, rows = read_csv_table(programs_path)
+        for row in rows:
+            # Clean up field names if needed (a repeated column keeps its last value)
+            cleaned_row = {
+                k.strip(): v.strip() for k, v in dict(zip(header, row)).items() if k and v
+            }
+            programs.append(cleaned_row)
+    except Exception as e:
+        logger.error(f"Error loading programs: {e}")
+        programs = []
+
+    name_index = defaultdict(list)
+    names_lower = []
+    department_index = defaultdict(list)
+    for program in programs:
+        if "Name" in program:
+            name_lower = program["Name"].lower()
+            name_index[name_lower].append(program)
+            names_lower.append((name_lower, program))
+        if "Department" in program:
+            department_index[program["Department"].lower()].append(program)
+
+    # Load majors data for descriptions
+    majors_descriptions = {}
+    try:
+        header, rows = read_csv_table(majors_path)
+        if "Department" in header and "Description" in header:
+            index = {name: i for i, name in enumerate(header)}
+            department_i, description_i = index["Department"], index["Description"]
+            for row in rows:
+                department, description = row[department_i], row[description_i]
+                dept = department.strip().lower()
+                desc = description.strip()
+                if dept and desc:
+                    majors_descriptions[dept] = desc
+    except Exception as e:
+        logger.error(f"Error loading majors descriptions: {e}")
+
+    return (
+        dict(name_index),
+        names_lower,
+        dict(department_index),
+        tuple(department_index),
+        majors_descriptions,
+    )
+
+
+def _extract_major_name(query_lower):
+    """Major/program name asked about in a lowercased, stripped query"""
     extracted_major = None
-    for pattern in major_patterns:
-        match = re.search(pattern, query_lower)
+    for pattern in _MAJOR_PATTERNS:
+        match = pattern.search(query_lower)
         if match:
             extracted_major = match.group(1).strip()
             break
@@ -244,88 +403,84 @@ def search_major_info(query, home_dir):
         )
         extracted_major = filtered_query.strip()
 
+    return extracted_major
+
+
+def search_major_info(query, home_dir):
+    """
+    Search for information about an academic major/program
+    with improved detection and formatting
+    """
+    # Normalize query
+    query_lower = query.lower().strip()
+
+    # Extract major name with improved patterns
+    extracted_major = _extract_major_name(query_lower)
+
     logger.info(f"Extracted major: {extracted_major}")
 
     # Define paths for both programs and majors CSVs
     programs_path = os.path.join(home_dir, "scrapedData", "classes", "programs.csv")
     majors_path = os.path.join(home_dir, "scrapedData", "classes", "majors.csv")
 
-    # Load programs data with error handling
-    programs = []
-    departments = set()
-    try:
-        with open(programs_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # Clean up field names if needed
-                cleaned_row = {k.strip(): v.strip() for k, v in row.items() if k and v}
-                programs.append(cleaned_row)
-                if "Department" in cleaned_row:
-                    departments.add(cleaned_row["Department"].lower())
-    except Exception as e:
-        logger.error(f"Error loading programs: {e}")
-        programs = []
-
-    # Load majors data for descriptions
-    majors_descriptions = {}
-    try:
-        with open(majors_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if "Department" in row and "Description" in row:
-                    dept = row["Department"].strip().lower()
-                    desc = row["Description"].strip()
-                    if dept and desc:
-                        majors_descriptions[dept] = desc
-    except Exception as e:
-        logger.error(f"Error loading majors descriptions: {e}")
+    # Load programs data and its lookup tables (rebuilt only when the CSVs change)
+    (
+        name_index,
+        names_lower,
+        department_index,
+        department_names,
+        majors_descriptions,
+    ) = _load_major_search_index(
+        programs_path, _file_mtime(programs_path), majors_path, _file_mtime(majors_path)
+    )
 
     # Search for matching programs - trying different matching approaches
 
     # 1. First try exact match on name
-    matched_programs = []
+    matched_programs = list(name_index.get(extracted_major, []))
     matched_department = None
 
-    for program in programs:
-        if "Name" in program and program["Name"].lower() == extracted_major:
-            matched_programs.append(program)
-            if "Department" in program:
-                matched_department = program["Department"]
+    for program in matched_programs:
+        if "Department" in program:
+            matched_department = program["Department"]
 
     # 2. Try partial match on name if no exact matches
     if not matched_programs:
-        for program in programs:
-            if "Name" in program and extracted_major in program["Name"].lower():
+        for name_lower, program in names_lower:
+            if extracted_major in name_lower:
                 matched_programs.append(program)
                 if "Department" in program and not matched_department:
                     matched_department = program["Department"]
 
     # 3. Try match on department
     if not matched_programs:
-        for program in programs:
-            if (
-                "Department" in program
-                and program["Department"].lower() == extracted_major
-            ):
-                matched_programs.append(program)
-                if not matched_department:
-                    matched_department = program["Department"]
+        matched_programs = list(department_index.get(extracted_major, []))
+        if matched_programs:
+            matched_department = matched_programs[0]["Department"]
 
     # 4. Try fuzzy matching for department if still no matches
-    if not matched_programs and departments:
+    if not matched_programs and department_names:
         # Try to find close matches to departments
-        close_matches = difflib.get_close_matches(
-            extracted_major, list(departments), n=1, cutoff=0.7
-        )
+        if fuzz_process is not None:
+            # Normalized Indel similarity (0-100), close to but not the same as
+            # difflib's ratio. Both sides are already lowercase, so no processor
+            # (rapidfuzz 2.x would otherwise strip punctuation by default)
+            match = fuzz_process.extractOne(
+                extracted_major,
+                department_names,
+                scorer=fuzz.ratio,
+                processor=None,
+                score_cutoff=70,
+            )
+            close_matches = [match[0]] if match else []
+        else:
+            close_matches = difflib.get_close_matches(
+                extracted_major, department_names, n=1, cutoff=0.7
+            )
         if close_matches:
             matched_department = close_matches[0]
             # Get all programs in that department
-            for program in programs:
-                if (
-                    "Department" in program
-                    and program["Department"].lower() == matched_department
-                ):
-                    matched_programs.append(program)
+            matched_programs = list(department_index[matched_department])
 
     # Get major description
     description = "No detailed information available."
@@ -390,24 +545,83 @@ For the most accurate and complete information, please visit the [UF Undergradua
 # ------------------------------
 # Data Loading Functions
 # ------------------------------
-def load_campus_buildings_data():
+def _intern(value):
+    """Intern string values, passing anything else through (short CSV rows give None)"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def read_csv_table(csv_path):
+    """
+    Parse a CSV file into (header, rows). Rows are tuples padded with None to the
+    header width (as DictReader does for short rows), plus one trailing "" that
+    missing columns are pointed at.
+    """
+    with open(csv_path, "r", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = tuple(next(reader, ()))
+        width = len(header)
+        padding = (None,) * width + ("",)
+        rows = [
+            tuple(row[:width]) + padding[min(len(row), width) :]
+            for row in reader
+            if row  # DictReader skips blank lines
+        ]
+    return header, rows
+
+
+def read_csv_columns(csv_path, columns):
+    """
+    Yield a tuple of the given columns for each row of a CSV file. Columns the
+    file doesn't have read as "", and cells missing from short rows read as None.
+    """
+    header, rows = read_csv_table(csv_path)
+    index = {name: i for i, name in enumerate(header)}
+    getter = operator.itemgetter(*(index.get(name, len(header)) for name in columns))
+    if len(columns) == 1:
+        return ((getter(row),) for row in rows)
+    return map(getter, rows)
+
+
+def _reload_on_change(relative_path):
+    """
+    Cache a loader's result for the current version of its CSV file under HOME_DIR.
+    The loader is called with the file's path and re-run once the file changes.
+    """
+
+    def decorator(loader):
+        @functools.lru_cache(maxsize=1)
+        def load_version(csv_path, mtime):
+            return loader(csv_path)
+
+        @functools.wraps(loader)
+        def wrapper():
+            csv_path = os.path.join(HOME_DIR, relative_path)
+            return load_version(csv_path, _file_mtime(csv_path))
+
+        wrapper.cache_clear = load_version.cache_clear
+        return wrapper
+
+    return decorator
+
+
+@_reload_on_change("scrapedData/campusBuildings/uf_buildings.csv")
+def load_campus_buildings_data(csv_path):
     """Load campus buildings data from CSV file"""
-    csv_path = os.path.join(HOME_DIR, "scrapedData/campusBuildings/uf_buildings.csv")
     buildings = []
 
     try:
-        with open(csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                buildings.append(
-                    {
-                        "Building Number": row.get("number", ""),
-                        "Building Name": row.get("name", ""),
-                        "Abbreviation": row.get("abbreviation", ""),
-                        "Address": row.get("address", ""),
-                        "Description": row.get("description", ""),
-                    }
-                )
+        for number, name, abbreviation, address, description in read_csv_columns(
+            csv_path, ("number", "name", "abbreviation", "address", "description")
+        ):
+            buildings.append(
+                {
+                    "Building Number": number,
+                    "Building Name": name,
+                    "Abbreviation": abbreviation,
+                    "Address": address,
+                    "Description": description,
+                }
+            )
         logger.info(
             f"[OK] Successfully loaded {len(buildings)} campus buildings from CSV"
         )
@@ -417,22 +631,22 @@ def load_campus_buildings_data():
         return []
 
 
-def load_clubs_data():
+@_reload_on_change("scrapedData/campusClubs/uf_organizations.csv")
+def load_clubs_data(csv_path):
     """Load clubs data from CSV file"""
-    csv_path = os.path.join(HOME_DIR, "scrapedData/campusClubs/uf_organizations.csv")
     clubs = []
 
     try:
-        with open(csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                clubs.append(
-                    {
-                        "Club ID": row.get("ID", ""),
-                        "Organization Name": row.get("Organization Name", ""),
-                        "Description": row.get("Description", ""),
-                    }
-                )
+        for club_id, name, description in read_csv_columns(
+            csv_path, ("ID", "Organization Name", "Description")
+        ):
+            clubs.append(
+                {
+                    "Club ID": club_id,
+                    "Organization Name": name,
+                    "Description": description,
+                }
+            )
         logger.info(f"[OK] Successfully loaded {len(clubs)} clubs from CSV")
         return clubs
     except Exception as e:
@@ -440,25 +654,26 @@ def load_clubs_data():
         return []
 
 
-def load_events_data():
+@_reload_on_change("scrapedData/campusEvents/uf_events_all.csv")
+def load_events_data(csv_path):
     """Load events data from CSV file"""
-    csv_path = os.path.join(HOME_DIR, "scrapedData/campusEvents/uf_events_all.csv")
     events = []
 
     try:
-        with open(csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                events.append(
-                    {
-                        "Event Name": row.get("name", ""),
-                        "Date": row.get("date", ""),
-                        "Time": row.get("time", ""),
-                        "Location": row.get("location", ""),
-                        "Link": row.get("link", ""),
-                        "Description": row.get("description", ""),
-                    }
-                )
+        for name, date, event_time, location, link, description in read_csv_columns(
+            csv_path, ("name", "date", "time", "location", "link", "description")
+        ):
+            events.append(
+                {
+                    # Low-cardinality columns are interned so rows share one string each
+                    "Event Name": name,
+                    "Date": _intern(date),
+                    "Time": _intern(event_time),
+                    "Location": _intern(location),
+                    "Link": link,
+                    "Description": description,
+                }
+            )
         logger.info(f"[OK] Successfully loaded {len(events)} events from CSV")
         return events
     except Exception as e:
@@ -466,26 +681,44 @@ def load_events_data():
         return []
 
 
-def load_courses_data():
+@_reload_on_change("scrapedData/classes/courses.csv")
+def load_courses_data(csv_path):
     """Load courses data from CSV file"""
-    csv_path = os.path.join(HOME_DIR, "scrapedData/classes/courses.csv")
     courses = []
 
     try:
-        with open(csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                courses.append(
-                    {
-                        "Department": row.get("department", ""),
-                        "Course Code": row.get("code", ""),
-                        "Course Title": row.get("title", ""),
-                        "Credit Count": row.get("credits", ""),
-                        "Description": row.get("description", ""),
-                        "Prerequisites": row.get("prerequisites", ""),
-                        "Grading Scheme": row.get("grading_scheme", ""),
-                    }
-                )
+        for (
+            department,
+            code,
+            title,
+            credit_count,
+            description,
+            prerequisites,
+            grading_scheme,
+        ) in read_csv_columns(
+            csv_path,
+            (
+                "department",
+                "code",
+                "title",
+                "credits",
+                "description",
+                "prerequisites",
+                "grading_scheme",
+            ),
+        ):
+            courses.append(
+                {
+                    # Low-cardinality columns are interned so rows share one string each
+                    "Department": _intern(department),
+                    "Course Code": code,
+                    "Course Title": title,
+                    "Credit Count": _intern(credit_count),
+                    "Description": description,
+                    "Prerequisites": prerequisites,
+                    "Grading Scheme": _intern(grading_scheme),
+                }
+            )
         logger.info(f"[OK] Successfully loaded {len(courses)} courses from CSV")
         return courses
     except Exception as e:
@@ -493,21 +726,21 @@ def load_courses_data():
         return []
 
 
-def load_majors_data():
+@_reload_on_change("scrapedData/classes/majors.csv")
+def load_majors_data(csv_path):
     """Load majors data from CSV file"""
-    csv_path = os.path.join(HOME_DIR, "scrapedData/classes/majors.csv")
     majors = []
 
     try:
-        with open(csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                majors.append(
-                    {
-                        "Department": row.get("department", ""),
-                        "Description": row.get("description", ""),
-                    }
-                )
+        for department, description in read_csv_columns(
+            csv_path, ("department", "description")
+        ):
+            majors.append(
+                {
+                    "Department": department,
+                    "Description": description,
+                }
+            )
         logger.info(f"[OK] Successfully loaded {len(majors)} majors from CSV")
         return majors
     except Exception as e:
@@ -515,23 +748,24 @@ def load_majors_data():
         return []
 
 
-def load_programs_data():
+@_reload_on_change("scrapedData/classes/programs.csv")
+def load_programs_data(csv_path):
     """Load programs data from CSV file"""
-    csv_path = os.path.join(HOME_DIR, "scrapedData/classes/programs.csv")
     programs = []
 
     try:
-        with open(csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                programs.append(
-                    {
-                        "Department": row.get("Department", ""),
-                        "Name": row.get("Name", ""),
-                        "URL": row.get("URL", ""),
-                        "Type": row.get("Type", ""),
-                    }
-                )
+        for department, name, url, program_type in read_csv_columns(
+            csv_path, ("Department", "Name", "URL", "Type")
+        ):
+            programs.append(
+                {
+                    # Low-cardinality columns are interned so rows share one string each
+                    "Department": _intern(department),
+                    "Name": name,
+                    "URL": url,
+                    "Type": _intern(program_type),
+                }
+            )
         logger.info(f"[OK] Successfully loaded {len(programs)} programs from CSV")
         return programs
     except Exception as e:
@@ -539,47 +773,62 @@ def load_programs_data():
         return []
 
 
-def load_hallinfo_data():
+@_reload_on_change("scrapedData/housing/hallInfo.csv")
+def load_hallinfo_data(csv_path):
     """Load hall info data from CSV file"""
-    csv_path = os.path.join(HOME_DIR, "scrapedData/housing/hallInfo.csv")
     hallinfo = []
 
     try:
-        with open(csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # Safely handle the splitting of string fields
-                features = (
-                    row.get("features_str", "").split(",")
-                    if row.get("features_str")
-                    else []
-                )
-                room_types = (
-                    row.get("room_types_str", "").split(",")
-                    if row.get("room_types_str")
-                    else []
-                )
-                nearby_locations = (
-                    row.get("nearby_locations_str", "").split(",")
-                    if row.get("nearby_locations_str")
-                    else []
-                )
+        for (
+            name,
+            hall_type,
+            description,
+            location,
+            phone,
+            features_str,
+            room_types_str,
+            nearby_locations_str,
+            url,
+            image_url,
+            rental_rate_url,
+        ) in read_csv_columns(
+            csv_path,
+            (
+                "name",
+                "hall_type",
+                "description",
+                "location",
+                "phone",
+                "features_str",
+                "room_types_str",
+                "nearby_locations_str",
+                "url",
+                "image_url",
+                "rental_rate_url",
+            ),
+        ):
+            # Safely handle the splitting of string fields
+            features = features_str.split(",") if features_str else []
+            room_types = room_types_str.split(",") if room_types_str else []
+            nearby_locations = (
+                nearby_locations_str.split(",") if nearby_locations_str else []
+            )
 
-                hallinfo.append(
-                    {
-                        "Building Name": row.get("name", ""),
-                        "Hall Type": row.get("hall_type", ""),
-                        "Description": row.get("description", ""),
-                        "Location": row.get("location", ""),
-                        "Phone": row.get("phone", ""),
-                        "Features": features,
-                        "Room Types": room_types,
-                        "Nearby Locations": nearby_locations,
-                        "URL": row.get("url", ""),
-                        "Image URL": row.get("image_url", ""),
-                        "Rental Rate URL": row.get("rental_rate_url", ""),
-                    }
-                )
+            hallinfo.append(
+                {
+                    "Building Name": name,
+                    "Hall Type": hall_type,
+                    "Description": description,
+                    "Location": location,
+                    "Phone": phone,
+                    "Features": features,
+                    "Room Types": room_types,
+                    "Nearby Locations": nearby_locations,
+                    "URL": url,
+                    "Image URL": image_url,
+                    "Rental Rate URL": rental_rate_url,
+                }
+            )
         logger.info(f"[OK] Successfully loaded {len(hallinfo)} hall info from CSV")
         return hallinfo
     except Exception as e:
@@ -587,75 +836,61 @@ def load_hallinfo_data():
         return []
 
 
-def load_libraries_data():
+def _lowercase_hours(hours):
+    """Hours keyed by lowercase day name (the first spelling of a day wins)"""
+    hours_lc = {}
+    for day, day_hours in hours.items():
+        if isinstance(day, str):
+            hours_lc.setdefault(day.lower(), day_hours)
+    return hours_lc
+
+
+@_reload_on_change("scrapedData/libraries/uf_libraries.csv")
+def load_libraries_data(csv_path):
     """Load libraries data from CSV file with enhanced parsing"""
-    csv_path = os.path.join(HOME_DIR, "scrapedData/libraries/uf_libraries.csv")
     libraries = []
 
     try:
-        with open(csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # More robust hours parsing
-                hours = {}
-                if "Hours" in row and row["Hours"]:
-                    try:
-                        # Try to parse hours from format like "7am - 2am (Sun-Thu) 7am - 10pm (Fri) 10am - 10pm (Sat)"
-                        hours_text = row["Hours"]
-
-                        # Parse specific day patterns
-                        day_patterns = [
-                            (
-                                r"([\d:]+\s*[ap]m\s*-\s*[\d:]+\s*[ap]m)\s*\((Sun-Thu|Mon-Thu|Mon-Fri)\)",
-                                ["Monday", "Tuesday", "Wednesday", "Thursday"],
-                            ),
-                            (
-                                r"([\d:]+\s*[ap]m\s*-\s*[\d:]+\s*[ap]m)\s*\((Fri)\)",
-                                ["Friday"],
-                            ),
-                            (
-                                r"([\d:]+\s*[ap]m\s*-\s*[\d:]+\s*[ap]m)\s*\((Sat)\)",
-                                ["Saturday"],
-                            ),
-                            (
-                                r"([\d:]+\s*[ap]m\s*-\s*[\d:]+\s*[ap]m)\s*\((Sun)\)",
-                                ["Sunday"],
-                            ),
-                        ]
+        for (
+            name,
+            location,
+            capacity,
+            hours_text,
+            special_notes,
+            url,
+            phone,
+            email,
+        ) in read_csv_columns(
+            csv_path,
+            (
+                "Library Name",
+                "Location",
+                "Capacity",
+                "Hours",
+                "Special Notes",
+                "URL",
+                "Phone",
+                "Email",
+            ),
+        ):
+            # More robust hours parsing
+            hours = {}
+            if hours_text:
+                try:
+                    # Try to parse hours from format like "7am - 2am (Sun-Thu) 7am - 10pm (Fri) 10am - 10pm (Sat)"
 
-                        for pattern, days in day_patterns:
-                            matches = re.findall(pattern, hours_text)
-                            if matches:
-                                for match in matches:
-                                    hour_str = (
-                                        match[0] if isinstance(match, tuple) else match
-                                    )
-                                    for day in days:
-                                        hours[day] = hour_str.strip()
-
-                        # Handle special cases
-                        if "Sun-Thu" in hours_text and not hours.get("Sunday"):
-                            if "Monday" in hours:
-                                hours["Sunday"] = hours["Monday"]
-
-                        # Fallback if specific patterns didn't work
-                        if not hours:
-                            days_of_week = [
-                                "Monday",
-                                "Tuesday",
-                                "Wednesday",
-                                "Thursday",
-                                "Friday",
-                                "Saturday",
-                                "Sunday",
-                            ]
-                            default_hours = "8:00am - 5:00pm"
-                            for day in days_of_week:
-                                if day not in hours:
-                                    hours[day] = default_hours
-                    except Exception as e:
-                        logger.warning(f"Error parsing library hours: {e}")
-                        # Create default hours if parsing fails
+                    # Parse specific day patterns
+                    for hour_str, tag in _HOURS_RE.findall(hours_text):
+                        for day in _DAY_MAP[tag]:
+                            hours[day] = hour_str.strip()
+
+                    # Handle special cases
+                    if "Sun-Thu" in hours_text and not hours.get("Sunday"):
+                        if "Monday" in hours:
+                            hours["Sunday"] = hours["Monday"]
+
+                    # Fallback if specific patterns didn't work
+                    if not hours:
                         days_of_week = [
                             "Monday",
                             "Tuesday",
@@ -667,20 +902,37 @@ def load_libraries_data():
                         ]
                         default_hours = "8:00am - 5:00pm"
                         for day in days_of_week:
-                            hours[day] = default_hours
-
-                libraries.append(
-                    {
-                        "Library Name": row.get("Library Name", ""),
-                        "Location": row.get("Location", ""),
-                        "Capacity": row.get("Capacity", ""),
-                        "Hours": hours,
-                        "Special Notes": row.get("Special Notes", ""),
-                        "URL": row.get("URL", ""),
-                        "Phone": row.get("Phone", ""),
-                        "Email": row.get("Email", ""),
-                    }
-                )
+                            if day not in hours:
+                                hours[day] = default_hours
+                except Exception as e:
+                    logger.warning(f"Error parsing library hours: {e}")
+                    # Create default hours if parsing fails
+                    days_of_week = [
+                        "Monday",
+                        "Tuesday",
+                        "Wednesday",
+                        "Thursday",
+                        "Friday",
+                        "Saturday",
+                        "Sunday",
+                    ]
+                    default_hours = "8:00am - 5:00pm"
+                    for day in days_of_week:
+                        hours[day] = default_hours
+
+            libraries.append(
+                {
+                    "Library Name": name,
+                    "Location": location,
+                    "Capacity": capacity,
+                    "Hours": hours,
+                    "_hours_lc": _lowercase_hours(hours),
+                    "Special Notes": special_notes,
+                    "URL": url,
+                    "Phone": phone,
+                    "Email": email,
+                }
+            )
         logger.info(f"[OK] Successfully loaded {len(libraries)} libraries from CSV")
         return libraries
     except Exception as e:
@@ -688,14 +940,57 @@ def load_libraries_data():
         return []
 
 
+def prefetch_all():
+    """Load every CSV dataset in parallel so later lookups hit the cache"""
+    loaders = [
+        load_campus_buildings_data,
+        load_clubs_data,
+        load_events_data,
+        load_courses_data,
+        load_majors_data,
+        load_programs_data,
+        load_hallinfo_data,
+        load_libraries_data,
+    ]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for loader in loaders:
+            executor.submit(loader)
+
+
 # ------------------------------
 # Caching for Embeddings
 # ------------------------------
+def _encode(model, texts, **kwargs):
+    """Run model.encode without autograd bookkeeping."""
+    with torch.inference_mode():
+        return model.encode(texts, **kwargs)
+
+
+def _prepare_embedding_model(model):
+    """Move an embedding model to the GPU in half precision when CUDA is available."""
+    if torch.cuda.is_available():
+        # FP16 halves memory traffic and uses tensor cores; embedding drift is negligible
+        model.to("cuda")
+        model.half()
+        try:
+            # Fused attention kernels (needs the optional `optimum` package)
+            first_module = model._first_module()
+            first_module.auto_model = first_module.auto_model.to_bettertransformer()
+        except Exception as e:
+            logger.debug(f"BetterTransformer not enabled for embedding model: {e}")
+    return model
+
+
+@functools.lru_cache(maxsize=4)
+def _get_model(model_name: str):
+    """Load each SentenceTransformer model once per process."""
+    return _prepare_embedding_model(SentenceTransformer(model_name))
+
+
 @functools.lru_cache(maxsize=128)
 def get_embedding(text: str, model_name: str = "all-MiniLM-L6-v2"):
-    """Return a cached embedding for a given text."""
-    embedder = SentenceTransformer(model_name)
-    return embedder.encode(text)
+    """Return a cached (unnormalized) embedding for a given text."""
+    return _encode(_get_model(model_name), text)
 
 
 # ------------------------------
@@ -706,8 +1001,8 @@ class LRUCache:
 
     def __init__(self, capacity=100):
         self.capacity = capacity
-        self.cache = {}
-        self.order = []
+        # Insertion order doubles as recency order (least recently used first)
+        self.cache = OrderedDict()
 
     def __contains__(self, key):
         return key in self.cache
@@ -717,28 +1012,47 @@ class LRUCache:
             return None
 
         # Update access order
-        self.order.remove(key)
-        self.order.append(key)
+        self.cache.move_to_end(key)
 
         return self.cache[key]
 
     def __setitem__(self, key, value):
         # If key exists, update order
         if key in self.cache:
-            self.order.remove(key)
+            self.cache.move_to_end(key)
         # If cache is full, remove least recently used item
         elif len(self.cache) >= self.capacity:
-            lru_key = self.order.pop(0)
-            del self.cache[lru_key]
+            self.cache.popitem(last=False)
 
         # Add new item
         self.cache[key] = value
-        self.order.append(key)
 
     def clear(self):
         """Clear the cache"""
-        self.cache = {}
-        self.order = []
+        self.cache.clear()
+
+
+class MajorSearchCache:
+    """
+    Cache in front of search_major_info, keyed on the extracted major name (the
+    only part of the query the search depends on), so rephrasings of the same
+    question share an entry. Entries are tied to the data directory and the
+    programs/majors file versions, so edited CSVs are never served stale.
+    """
+
+    def __init__(self, capacity=500):
+        # (home_dir, data version, extracted major) -> result
+        self.entries = LRUCache(capacity=capacity)
+
+    def search(self, query, home_dir):
+        version = (
+            _file_mtime(os.path.join(home_dir, "scrapedData/classes/programs.csv")),
+            _file_mtime(os.path.join(home_dir, "scrapedData/classes/majors.csv")),
+        )
+        key = (home_dir, version, _extract_major_name(query.lower().strip()))
+        if key not in self.entries:
+            self.entries[key] = search_major_info(query, home_dir)
+        return self.entries[key]
 
 
 # ------------------------------
@@ -749,7 +1063,8 @@ class ConversationState:
 
     def __init__(self, max_history=10):
         self.max_history = max_history
-        self.history = []
+        # Only the most recent messages are kept; the deque drops the oldest itself
+        self.history = deque(maxlen=max_history)
         self.current_library = None
         self.current_building = None
         self.current_dorm = None
@@ -758,14 +1073,9 @@ class ConversationState:
         self.current_club = None
         self.awaiting_followup = False
         self.last_intent = None
-        self.mentioned_entities = {
-            "libraries": set(),
-            "buildings": set(),
-            "dorms": set(),
-            "courses": set(),
-            "majors": set(),
-            "clubs": set(),
-        }
+        # Entity names mentioned so far, by kind ("libraries", "majors", ...);
+        # a kind's set is only created once something of that kind comes up
+        self.mentioned_entities = defaultdict(set)
         self.intent_counts = defaultdict(int)  # Track common intents for user
         self.is_personal_query = False
         self.last_query_time = None
@@ -787,10 +1097,6 @@ class ConversationState:
         timestamp = current_time.strftime("%H:%M:%S")
         self.history.append(f"[{timestamp}] {speaker}: {message}")
 
-        # Keep only the most recent messages
-        if len(self.history) > self.max_history:
-            self.history = self.history[-self.max_history :]
-
         # If it's the assistant's message, update followup expectation
         if speaker == "Assistant":
             # Check if the response ends with a question or suggestion
@@ -876,7 +1182,7 @@ class ConversationState:
             "majors",
             "clubs",
         ]:
-            if self.mentioned_entities[entity_type]:
+            if self.mentioned_entities.get(entity_type):
                 most_recent = list(self.mentioned_entities[entity_type])[-1]
                 if most_recent.lower() in query.lower():
                     return True
@@ -909,32 +1215,24 @@ class ConversationState:
     def get_history(self) -> str:
         return "\n".join(self.history)
 
+    # Entity type -> mentioned_entities kind
+    _ENTITY_KINDS = {
+        "library": "libraries",
+        "building": "buildings",
+        "dorm": "dorms",
+        "course": "courses",
+        "major": "majors",
+        "club": "clubs",
+    }
+
     def set_active_entity(self, entity_type, entity_data, name_key):
         """Generalized method to set active entities"""
-        if entity_type == "library":
-            self.current_library = entity_data
-            if entity_data and name_key in entity_data:
-                self.mentioned_entities["libraries"].add(entity_data[name_key])
-        elif entity_type == "building":
-            self.current_building = entity_data
-            if entity_data and name_key in entity_data:
-                self.mentioned_entities["buildings"].add(entity_data[name_key])
-        elif entity_type == "dorm":
-            self.current_dorm = entity_data
-            if entity_data and name_key in entity_data:
-                self.mentioned_entities["dorms"].add(entity_data[name_key])
-        elif entity_type == "course":
-            self.current_course = entity_data
-            if entity_data and name_key in entity_data:
-                self.mentioned_entities["courses"].add(entity_data[name_key])
-        elif entity_type == "major":
-            self.current_major = entity_data
-            if entity_data and name_key in entity_data:
-                self.mentioned_entities["majors"].add(entity_data[name_key])
-        elif entity_type == "club":
-            self.current_club = entity_data
-            if entity_data and name_key in entity_data:
-                self.mentioned_entities["clubs"].add(entity_data[name_key])
+        kind = self._ENTITY_KINDS.get(entity_type)
+        if kind is None:
+            return
+        setattr(self, f"current_{entity_type}", entity_data)
+        if entity_data and name_key in entity_data:
+            self.mentioned_entities[kind].add(_intern(entity_data[name_key]))
 
     def set_active_library(self, library):
         """Set the active library for the conversation"""
@@ -973,11 +1271,11 @@ class ConversationState:
         if isinstance(major, dict) and "department" in major:
             # For structured academic info
             self.current_major = major
-            self.mentioned_entities["majors"].add(major["department"])
+            self.mentioned_entities["majors"].add(_intern(major["department"]))
         elif isinstance(major, dict) and "response" in major:
             # For new response-based format
             self.current_major = major
-            self.mentioned_entities["majors"].add(major["query"])
+            self.mentioned_entities["majors"].add(_intern(major["query"]))
         else:
             # For legacy format
             self.set_active_entity("major", major, "Department")
@@ -1035,7 +1333,7 @@ class ConversationState:
 
             if entity_type and entity_name:
                 # Check if any other entity of this type is mentioned
-                for mentioned in self.mentioned_entities[entity_type]:
+                for mentioned in self.mentioned_entities.get(entity_type, ()):
                     if (
                         mentioned.lower() in query_lower
                         and mentioned.lower() != entity_name.lower()
@@ -1082,6 +1380,7 @@ class AcademicInfoRetrieval:
 
         # Create department indexes and mappings
         self._create_indexes()
+        self._department_embeddings = None
 
         self.query_cache = LRUCache(capacity=100)
         logger.info(
@@ -1126,6 +1425,18 @@ class AcademicInfoRetrieval:
                     if len(abbr) > 1:
                         self.search_terms[abbr.lower()] = dept
 
+    def _get_department_embeddings(self):
+        """Encode all department names in one batch on first use and reuse them"""
+        if self._department_embeddings is None:
+            dept_names = list(self.department_programs.keys())
+            embeddings = (
+                torch.as_tensor(_encode(self.embedding_model, dept_names, batch_size=32))
+                if dept_names
+                else None
+            )
+            self._department_embeddings = (dept_names, embeddings)
+        return self._department_embeddings
+
     def get_info(self, query: str) -> dict:
         """Get comprehensive information about an academic program or department"""
         # Check cache first
@@ -1232,23 +1543,24 @@ class AcademicInfoRetrieval:
         if not result["programs"]:
             try:
                 # Encode query
-                query_embedding = self.embedding_model.encode(query_lower)
+                query_embedding = torch.as_tensor(
+                    _encode(self.embedding_model, query_lower)
+                ).reshape(1, -1)
                 best_match = None
                 best_score = 0
 
                 # Search for department match first
-                for dept in self.department_programs.keys():
-                    dept_embedding = self.embedding_model.encode(dept)
-
-                    # Calculate cosine similarity
-                    similarity = torch.nn.functional.cosine_similarity(
-                        torch.tensor(query_embedding).unsqueeze(0),
-                        torch.tensor(dept_embedding).unsqueeze(0),
-                    ).item()
-
-                    if similarity > best_score:
-                        best_score = similarity
-                        best_match = dept
+                dept_names, dept_embeddings = self._get_department_embeddings()
+                if dept_names:
+                    # Cosine similarity against every department at once
+                    similarities = torch.nn.functional.cosine_similarity(
+                        query_embedding,
+                        dept_embeddings.reshape(-1, query_embedding.shape[1]),
+                    )
+                    best_index = int(similarities.argmax())
+                    if similarities[best_index].item() > best_score:
+                        best_score = similarities[best_index].item()
+                        best_match = dept_names[best_index]
 
                 if best_match and best_score > 0.7:
                     result["department"] = best_match
@@ -1306,11 +1618,35 @@ class CampusClubsRetrieval:
     def __init__(self, embedding_model: SentenceTransformer):
         self.embedding_model = embedding_model
         self.club_data = load_clubs_data()
+        # Lowercased club names, built once for the fuzzy-match fallback
+        self._club_names_lower = tuple(
+            entry.get("Organization Name", "").lower() for entry in self.club_data
+        )
         self.query_cache = LRUCache(capacity=100)
+        self._club_embeddings = None
         logger.info(
             f"Initialized campus clubs retrieval with {len(self.club_data)} entries."
         )
 
+    def _get_club_embeddings(self):
+        """Encode every named club in one batch on first use and reuse the result"""
+        if self._club_embeddings is None:
+            entries = [
+                entry for entry in self.club_data if entry.get("Organization Name", "")
+            ]
+            # Use all information for better matching
+            entry_texts = [
+                f"{entry['Organization Name']} {entry.get('Description', '')}"
+                for entry in entries
+            ]
+            embeddings = (
+                torch.as_tensor(_encode(self.embedding_model, entry_texts, batch_size=32))
+                if entries
+                else None
+            )
+            self._club_embeddings = (entries, embeddings)
+        return self._club_embeddings
+
     def get_club_info(self, query: str) -> str:
         # Check cache first
         cache_key = f"club:{query.lower()}"
@@ -1338,9 +1674,8 @@ class CampusClubsRetrieval:
                 return result
 
         # Try fuzzy matching with improved threshold
-        names = [entry.get("Organization Name", "") for entry in self.club_data]
         best_matches = difflib.get_close_matches(
-            query_lower, [name.lower() for name in names], n=1, cutoff=0.7
+            query_lower, self._club_names_lower, n=1, cutoff=0.7
         )  # Higher threshold
         if best_matches:
             for entry in self.club_data:
@@ -1353,30 +1688,23 @@ class CampusClubsRetrieval:
 
         # Try semantic search with enhanced similarity scoring
         try:
-            query_embedding = self.embedding_model.encode(query_lower)
+            query_embedding = torch.as_tensor(
+                _encode(self.embedding_model, query_lower)
+            ).reshape(1, -1)
             best_match = None
             best_score = 0
 
-            for entry in self.club_data:
-                name = entry.get("Organization Name", "")
-                desc = entry.get("Description", "")
-
-                if not name:
-                    continue
-
-                # Use all information for better matching
-                entry_text = f"{name} {desc}"
-                entry_embedding = self.embedding_model.encode(entry_text)
-
-                # Calculate cosine similarity
-                similarity = torch.nn.functional.cosine_similarity(
-                    torch.tensor(query_embedding).unsqueeze(0),
-                    torch.tensor(entry_embedding).unsqueeze(0),
-                ).item()
-
-                if similarity > best_score:
-                    best_score = similarity
-                    best_match = entry
+            entries, entry_embeddings = self._get_club_embeddings()
+            if entries:
+                # Cosine similarity against every club at once
+                similarities = torch.nn.functional.cosine_similarity(
+                    query_embedding,
+                    entry_embeddings.reshape(-1, query_embedding.shape[1]),
+                )
+                best_index = int(similarities.argmax())
+                if similarities[best_index].item() > best_score:
+                    best_score = similarities[best_index].item()
+                    best_match = entries[best_index]
 
             if best_match and best_score > 0.7:  # Higher threshold for better quality
                 result = best_match.get(
@@ -1493,79 +1821,176 @@ class CampusClubsRetrieval:
 # ------------------------------
 # Query Analyzer
 # ------------------------------
+# Intent detection patterns, compiled once and matched against the lowercased query
+_INTENT_PATTERNS = {
+    intent: tuple(re.compile(pattern) for pattern in patterns)
+    for intent, patterns in {
+        "library_hours": [
+            r"(?:library|lib).*hours",
+            r"hours.*(?:library|lib)",
+            r"when.*(?:library|lib).*open",
+            r"(?:library|lib).*open.*?when",
+            r"(?:library|lib).*close",
+            r"is (?:library|lib) open",
+            r"(?:library|lib).*schedule",
+        ],
+        "building_location": [
+            r"where is",
+            r"location of",
+            r"located",
+            r"address",
+            r"find",
+            r"get to",
+            r"directions to",
+            r"how.*get to",
+            r"where.*find",
+            r"map",
+        ],
+        "dorm_info": [
+            r"dorm",
+            r"housing",
+            r"residence hall",
+            r"live",
+            r"on-campus housing",
+            r"rooms",
+            r"housing options",
+            r"where to live",
+            r"accommodation",
+            r"freshman.*housing",
+        ],
+        "course_info": [
+            r"course",
+            r"class",
+            r"(?:course|class).*description",
+            r"about.*(?:course|class)",
+            r"syllabus",
+            r"prereq",
+            r"credit",
+            r"professor",
+            r"instructor",
+            r"teach",
+            r"[A-Z]{3}\s*\d{4}",
+        ],
+        "major_info": [
+            r"major",
+            r"program",
+            r"degree",
+            r"concentration",
+            r"department",
+            r"field of study",
+            r"academic program",
+            r"specialization",
+            r"track",
+        ],
+        "club_info": [
+            r"club",
+            r"organization",
+            r"group",
+            r"society",
+            r"association",
+            r"student org",
+            r"student group",
+            r"extracurricular",
+            r"activities",
+        ],
+    }.items()
+}
+
+# Entity extraction patterns for QueryAnalyzer.analyze, each list tried in order
+_COURSE_CODE_RE = re.compile(r"([A-Z]{3})\s*(\d{4}[A-Za-z]*)")
+_COURSE_CODE_HINT_RE = re.compile(r"[A-Z]{3}\s*\d{4}")
+_ANALYZER_MAJOR_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in [
+        r"major in\s+([a-zA-Z\s&]+)(?:\s|$|\.|\?)",
+        r"studying\s+([a-zA-Z\s&]+)(?:\s|$|\.|\?)",
+        r"about\s+([a-zA-Z\s&]+)\s+major",
+        r"about\s+([a-zA-Z\s&]+)\s+program",
+    ]
+)
+_LIBRARY_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in [
+        r"(library\s+west)",
+        r"(marston\s+(?:science\s+)?library)",
+        r"(smathers\s+library)",
+        r"(west\s+library)",
+        r"(lib\s+west)",
+        r"(health\s+science\s+(?:center\s+)?library)",
+        r"(architecture\s+(?:&|and)\s+fine\s+arts\s+library)",
+        r"(education\s+library)",
+        r"(legal\s+information\s+center)",
+        r"(law\s+library)",
+    ]
+)
+_BUILDING_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in [
+        r"(reitz\s+union)",
+        r"(century\s+tower)",
+        r"(ben\s+hill\s+griffin\s+stadium)",
+        r"(the\s+swamp)",
+        r"(turlington\s+hall)",
+        r"(norman\s+hall)",
+        r"(dickinson\s+hall)",
+        r"(matherly\s+hall)",
+        r"(tigert\s+hall)",
+        r"(newell\s+hall)",
+        r"(weil\s+hall)",
+    ]
+)
+_DORM_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in [
+        r"(broward\s+hall)",
+        r"(jennings\s+hall)",
+        r"(rawlings\s+hall)",
+        r"(simpson\s+hall)",
+        r"(cypress\s+hall)",
+        r"(hume\s+hall)",
+        r"(springs\s+complex)",
+        r"(beaty\s+towers)",
+        r"(keys\s+complex)",
+        r"(yulee\s+hall)",
+        r"(reid\s+hall)",
+        r"(murphree\s+hall)",
+        r"(thomas\s+hall)",
+    ]
+)
+
+# Explicit major keywords and academic field names (common majors) for is_major_query.
+# Matched as substrings, so "majors", "programs" and "studying" count too.
+_MAJOR_KEYWORDS = (
+    "major",
+    "program",
+    "degree",
+    "study",
+    "department",
+    "concentration",
+    "specialization",
+)
+_COMMON_MAJORS = (
+    "computer science",
+    "engineering",
+    "business",
+    "psychology",
+    "biology",
+    "chemistry",
+    "economics",
+    "english",
+    "history",
+    "mathematics",
+    "physics",
+    "political science",
+    "sociology",
+)
+_MAJOR_QUERY_RE = re.compile("|".join(map(re.escape, _MAJOR_KEYWORDS + _COMMON_MAJORS)))
+
+
 class QueryAnalyzer:
     def __init__(self):
-        # Define comprehensive patterns for intent detection with prioritization
-        self.intent_patterns = {
-            "library_hours": [
-                r"(?:library|lib).*hours",
-                r"hours.*(?:library|lib)",
-                r"when.*(?:library|lib).*open",
-                r"(?:library|lib).*open.*?when",
-                r"(?:library|lib).*close",
-                r"is (?:library|lib) open",
-                r"(?:library|lib).*schedule",
-            ],
-            "building_location": [
-                r"where is",
-                r"location of",
-                r"located",
-                r"address",
-                r"find",
-                r"get to",
-                r"directions to",
-                r"how.*get to",
-                r"where.*find",
-                r"map",
-            ],
-            "dorm_info": [
-                r"dorm",
-                r"housing",
-                r"residence hall",
-                r"live",
-                r"on-campus housing",
-                r"rooms",
-                r"housing options",
-                r"where to live",
-                r"accommodation",
-                r"freshman.*housing",
-            ],
-            "course_info": [
-                r"course",
-                r"class",
-                r"(?:course|class).*description",
-                r"about.*(?:course|class)",
-                r"syllabus",
-                r"prereq",
-                r"credit",
-                r"professor",
-                r"instructor",
-                r"teach",
-                r"[A-Z]{3}\s*\d{4}",
-            ],
-            "major_info": [
-                r"major",
-                r"program",
-                r"degree",
-                r"concentration",
-                r"department",
-                r"field of study",
-                r"academic program",
-                r"specialization",
-                r"track",
-            ],
-            "club_info": [
-                r"club",
-                r"organization",
-                r"group",
-                r"society",
-                r"association",
-                r"student org",
-                r"student group",
-                r"extracurricular",
-                r"activities",
-            ],
-        }
+        # Comprehensive patterns for intent detection (compiled at module load)
+        self.intent_patterns = _INTENT_PATTERNS
 
         # Intent priority order (for resolving multiple matches)
         self.intent_priority = [
@@ -1602,7 +2027,7 @@ class QueryAnalyzer:
             ),
             "is_course_query": "course" in query_lower
             or "class" in query_lower
-            or re.search(r"[A-Z]{3}\s*\d{4}", query),
+            or _COURSE_CODE_HINT_RE.search(query),
             "is_all_query": any(
                 kw in query_lower
                 for kw in ["all ", "list of", "what are the", "types of"]
@@ -1618,7 +2043,7 @@ class QueryAnalyzer:
         # Check for specific intents
         for intent, patterns in self.intent_patterns.items():
             for pattern in patterns:
-                if re.search(pattern, query_lower):
+                if pattern.search(query_lower):
                     matched_intents.append(intent)
                     break
 
@@ -1631,86 +2056,36 @@ class QueryAnalyzer:
         # Extract potential entities with improved regex
         if analysis["is_major_query"]:
             # Look for major names after "major in", "studying", etc.
-            major_patterns = [
-                r"major in\s+([a-zA-Z\s&]+)(?:\s|$|\.|\?)",
-                r"studying\s+([a-zA-Z\s&]+)(?:\s|$|\.|\?)",
-                r"about\s+([a-zA-Z\s&]+)\s+major",
-                r"about\s+([a-zA-Z\s&]+)\s+program",
-            ]
-            for pattern in major_patterns:
-                match = re.search(pattern, query_lower)
+            for pattern in _ANALYZER_MAJOR_PATTERNS:
+                match = pattern.search(query_lower)
                 if match:
                     analysis["potential_major"] = match.group(1).strip()
                     break
 
         if analysis["is_course_query"]:
             # Look for course codes (e.g., "COP 3502" or "COP3502")
-            course_code_pattern = r"([A-Z]{3})\s*(\d{4}[A-Za-z]*)"
-            matches = re.findall(course_code_pattern, query)
+            matches = _COURSE_CODE_RE.findall(query)
             if matches:
                 analysis["potential_course_code"] = f"{matches[0][0]} {matches[0][1]}"
 
         # Look for library names
         if "library" in query_lower or "lib" in query_lower:
-            library_patterns = [
-                r"(library\s+west)",
-                r"(marston\s+(?:science\s+)?library)",
-                r"(smathers\s+library)",
-                r"(west\s+library)",
-                r"(lib\s+west)",
-                r"(health\s+science\s+(?:center\s+)?library)",
-                r"(architecture\s+(?:&|and)\s+fine\s+arts\s+library)",
-                r"(education\s+library)",
-                r"(legal\s+information\s+center)",
-                r"(law\s+library)",
-            ]
-
-            for pattern in library_patterns:
-                match = re.search(pattern, query_lower)
+            for pattern in _LIBRARY_PATTERNS:
+                match = pattern.search(query_lower)
                 if match:
                     analysis["potential_library"] = match.group(1).strip()
                     break
 
         # Look for building names
-        building_patterns = [
-            r"(reitz\s+union)",
-            r"(century\s+tower)",
-            r"(ben\s+hill\s+griffin\s+stadium)",
-            r"(the\s+swamp)",
-            r"(turlington\s+hall)",
-            r"(norman\s+hall)",
-            r"(dickinson\s+hall)",
-            r"(matherly\s+hall)",
-            r"(tigert\s+hall)",
-            r"(newell\s+hall)",
-            r"(weil\s+hall)",
-        ]
-
-        for pattern in building_patterns:
-            match = re.search(pattern, query_lower)
+        for pattern in _BUILDING_PATTERNS:
+            match = pattern.search(query_lower)
             if match:
                 analysis["potential_building"] = match.group(1).strip()
                 break
 
         # Look for dorm names
-        dorm_patterns = [
-            r"(broward\s+hall)",
-            r"(jennings\s+hall)",
-            r"(rawlings\s+hall)",
-            r"(simpson\s+hall)",
-            r"(cypress\s+hall)",
-            r"(hume\s+hall)",
-            r"(springs\s+complex)",
-            r"(beaty\s+towers)",
-            r"(keys\s+complex)",
-            r"(yulee\s+hall)",
-            r"(reid\s+hall)",
-            r"(murphree\s+hall)",
-            r"(thomas\s+hall)",
-        ]
-
-        for pattern in dorm_patterns:
-            match = re.search(pattern, query_lower)
+        for pattern in _DORM_PATTERNS:
+            match = pattern.search(query_lower)
             if match:
                 analysis["potential_dorm"] = match.group(1).strip()
                 break
@@ -1722,41 +2097,8 @@ class QueryAnalyzer:
         """Enhanced detection for academic major queries"""
         query_lower = query.lower()
 
-        # Check for explicit major keywords
-        major_keywords = [
-            "major",
-            "program",
-            "degree",
-            "study",
-            "department",
-            "concentration",
-            "specialization",
-        ]
-
-        if any(keyword in query_lower for keyword in major_keywords):
-            return True
-
-        # Check for academic field names (common majors)
-        common_majors = [
-            "computer science",
-            "engineering",
-            "business",
-            "psychology",
-            "biology",
-            "chemistry",
-            "economics",
-            "english",
-            "history",
-            "mathematics",
-            "physics",
-            "political science",
-            "sociology",
-        ]
-
-        if any(major in query_lower for major in common_majors):
-            return True
-
-        return False
+        # Any major keyword or common major name, anywhere in the query
+        return _MAJOR_QUERY_RE.search(query_lower) is not None
 
 
 # ------------------------------
@@ -1768,9 +2110,10 @@ class ResponseGenerator:
     def __init__(self, llm=None):
         self.llm = llm
 
-        # Template responses for common queries with consistent formatting
-        self.templates = {
-            "hours": """
+        # Template responses for common queries with consistent formatting, as
+        # f-string renderers so the placeholders are parsed once at compile time
+        self._render = {
+            "hours": lambda library_name, day_of_week, hours_today, all_hours, special_hours_note: f"""
 📚 {library_name} Hours
 
 Today ({day_of_week}): {hours_today}
@@ -1779,19 +2122,19 @@ Weekly Schedule:
 {all_hours}
 {special_hours_note}
 """,
-            "location": """
+            "location": lambda entity_name, location: f"""
 🏢 {entity_name}
 
 📍 Located at: {location}
 """,
-            "building_info": """
+            "building_info": lambda building_name, abbr_text, address, description: f"""
 🏢 {building_name}{abbr_text}
 
 📍 Location: {address}
 
 {description}
 """,
-            "dorm_info": """
+            "dorm_info": lambda dorm_name, location, hall_type, description, features_list: f"""
 🏠 {dorm_name}
 
 📍 Location: {location}
@@ -1802,7 +2145,7 @@ Weekly Schedule:
 Features include:
 {features_list}
 """,
-            "course_info": """
+            "course_info": lambda course_code, course_title, credits, description, prerequisites: f"""
 📚 {course_code}: {course_title}
 
 Credits: {credits}
@@ -1811,7 +2154,7 @@ Credits: {credits}
 
 Prerequisites: {prerequisites}
 """,
-            "major_info": """
+            "major_info": lambda major_name, department, college_info, type_info, description, programs_list: f"""
 🎓 {major_name}
 
 Department: {department}
@@ -1822,7 +2165,7 @@ Department: {department}
 
 {programs_list}
 """,
-            "program_detail": """
+            "program_detail": lambda program_name, program_type, department, college, catalog_url: f"""
 Program: {program_name}
 Type: {program_type}
 Department: {department}
@@ -1830,22 +2173,22 @@ Department: {department}
 
 {catalog_url}
 """,
-            "club_info": """
+            "club_info": lambda club_name, description: f"""
 🎭 {club_name}
 
 {description}
 """,
-            "personal_query": """
+            "personal_query": lambda personal_type: f"""
 I don't have access to your personal information such as {personal_type}. As an AI assistant, I can only provide general information about UF.
 
 For personalized information, please visit ONE.UF or contact the relevant department directly.
 """,
-            "meta_question": """
+            "meta_question": lambda: """
 I'm the UF Assistant, an AI designed to provide helpful information about the University of Florida. I can answer questions about campus buildings, libraries, housing, academic programs, and other UF-related topics.
 
 How can I help you today?
 """,
-            "error": """
+            "error": lambda query_subject: f"""
 I apologize, but I couldn't find specific information about {query_subject}. Could you try rephrasing your question or asking about something else?
 """,
         }
@@ -1876,21 +2219,21 @@ I apologize, but I couldn't find specific information about {query_subject}. Cou
                 )
             except Exception as e:
                 logger.error(f"Error generating library hours response: {e}")
-                return self.templates["error"].format(query_subject="library hours")
+                return self._render["error"](query_subject="library hours")
 
         elif intent == "building_location" and building_info:
             try:
                 return self._generate_building_location_response(building_info)
             except Exception as e:
                 logger.error(f"Error generating building location response: {e}")
-                return self.templates["error"].format(query_subject="building location")
+                return self._render["error"](query_subject="building location")
 
         elif intent == "dorm_info" and dorm_info:
             try:
                 return self._generate_dorm_info_response(dorm_info)
             except Exception as e:
                 logger.error(f"Error generating dorm info response: {e}")
-                return self.templates["error"].format(
+                return self._render["error"](
                     query_subject="dormitory information"
                 )
 
@@ -1903,14 +2246,14 @@ I apologize, but I couldn't find specific information about {query_subject}. Cou
                     return self._generate_major_info_response(major_info)
             except Exception as e:
                 logger.error(f"Error generating major info response: {e}")
-                return self.templates["error"].format(query_subject="major information")
+                return self._render["error"](query_subject="major information")
 
         elif intent == "club_info" and club_info:
             try:
                 return self._generate_club_info_response(club_info)
             except Exception as e:
                 logger.error(f"Error generating club info response: {e}")
-                return self.templates["error"].format(query_subject="club information")
+                return self._render["error"](query_subject="club information")
 
         # Check for valid entity information that might not match the intent
         if library_info and not intent == "library_hours":
@@ -2004,7 +2347,7 @@ I apologize, but I couldn't find specific information about {query_subject}. Cou
         else:
             personal_type = "personal information"
 
-        return self.templates["personal_query"].format(personal_type=personal_type)
+        return self._render["personal_query"](personal_type=personal_type)
 
     def _generate_library_hours_response(self, library, academic_calendar=None):
         """Generate response for library hours query with robust data validation"""
@@ -2015,8 +2358,9 @@ I apologize, but I couldn't find specific information about {query_subject}. Cou
         if isinstance(library.get("Hours"), dict):
             logger.info(f"Library hours keys: {library.get('Hours').keys()}")
 
-        # Get today's day of week
-        today = datetime.now().strftime("%A")
+        # Get today's day of week (one clock read serves the calendar check below too)
+        now = datetime.now()
+        today = now.strftime("%A")
 
         # Get hours for today with validation
         hours_today = "Information not available"
@@ -2027,18 +2371,21 @@ I apologize, but I couldn't find specific information about {query_subject}. Cou
             if today in hours_data:
                 hours_today = hours_data[today]
             else:
-                # Try case-insensitive match
-                for day, hours in hours_data.items():
-                    if isinstance(day, str) and day.lower() == today.lower():
-                        hours_today = hours
-                        break
+                # Try case-insensitive match through the lowercase-keyed view the
+                # loader stores next to "Hours"; rows from elsewhere get one built here
+                hours_lc = library.get("_hours_lc")
+                if hours_lc is None:
+                    hours_lc = _lowercase_hours(hours_data)
+                hours_today = hours_lc.get(today.lower(), hours_today)
 
         # Format all hours with validation
         all_hours = ""
         if isinstance(hours_data, dict) and hours_data:
-            for day, hours in hours_data.items():
-                if isinstance(day, str) and isinstance(hours, str):
-                    all_hours += f"• {day}: {hours}\n"
+            all_hours = "\n".join(
+                f"• {day}: {hours}"
+                for day, hours in hours_data.items()
+                if isinstance(day, str) and isinstance(hours, str)
+            )
 
         # If no hours found, use default hours
         if not all_hours:
@@ -2047,7 +2394,7 @@ I apologize, but I couldn't find specific information about {query_subject}. Cou
         # Check for special hours from academic calendar
         special_hours_note = ""
         if academic_calendar and isinstance(academic_calendar, dict):
-            today_str = datetime.now().strftime("%Y-%m-%d")
+            today_str = now.strftime("%Y-%m-%d")
             exceptions = academic_calendar.get("library_schedule_exceptions", {})
 
             if isinstance(exceptions, dict) and today_str in exceptions:
@@ -2061,7 +2408,7 @@ I apologize, but I couldn't find specific information about {query_subject}. Cou
                         )
 
         # Format and return the response
-        response = self.templates["hours"].format(
+        response = self._render["hours"](
             library_name=library_name,
             day_of_week=today,
             hours_today=hours_today,
@@ -2128,7 +2475,7 @@ I apologize, but I couldn't find specific information about {query_subject}. Cou
         library_name = library.get("Library Name", "Unknown Library")
         location = library.get("Location", "University of Florida campus")
 
-        response = self.templates["location"].format(
+        response = self._render["location"](
             entity_name=library_name, location=location
         )
 
@@ -2171,7 +2518,7 @@ I apologize, but I couldn't find specific information about {query_subject}. Cou
 
         abbr_text = f" ({abbr})" if abbr else ""
 
-        response = self.templates["building_info"].format(
+        response = self._render["building_info"](
             building_name=building_name,
             abbr_text=abbr_text,
             address=address,
@@ -2190,14 +2537,16 @@ I apologize, but I couldn't find specific information about {query_subject}. Cou
         # Format features list with validation
         features_list = ""
         if dorm.get("Features") and isinstance(dorm["Features"], list):
-            for feature in dorm["Features"]:
-                if feature and isinstance(feature, str) and feature.strip():
-                    features_list += f"• {feature.strip()}\n"
+            features_list = "".join(
+                f"• {feature.strip()}\n"
+                for feature in dorm["Features"]
+                if feature and isinstance(feature, str) and feature.strip()
+            )
 
         if not features_list:
             features_list = "• Standard residence hall amenities\n• Study spaces\n• Laundry facilities\n• High-speed internet"
 
-        response = self.templates["dorm_info"].format(
+        response = self._render["dorm_info"](
             dorm_name=dorm_name,
             hall_type=hall_type,
             location=location,
@@ -2223,7 +2572,7 @@ I apologize, but I couldn't find specific information about {query_subject}. Cou
         # Create a properly capitalized name
         display_name = " ".join(word.capitalize() for word in major_name.split())
 
-        response = self.templates["major_info"].format(
+        response = self._render["major_info"](
             major_name=display_name,
             department=department,
             college_info="",
@@ -2274,7 +2623,7 @@ I apologize, but I couldn't find specific information about {query_subject}. Cou
         # Format programs list
         programs_list = ""
         if programs:
-            programs_list = "Available Programs:\n"
+            program_entries = ["Available Programs:"]
             for program in programs:
                 name = program.get("Name", "")
                 url = program.get("URL", "")
@@ -2284,10 +2633,11 @@ I apologize, but I couldn't find specific information about {query_subject}. Cou
                     program_entry = f"• {name} ({prog_type})"
                     if url:
                         program_entry += f" - Catalog: https://catalog.ufl.edu{url}"
-                    programs_list += program_entry + "\n"
+                    program_entries.append(program_entry)
+            programs_list = "\n".join(program_entries) + "\n"
 
         # Format the response
-        response = self.templates["major_info"].format(
+        response = self._render["major_info"](
             major_name=display_name,
             department=department,
             college_info=college_info,
@@ -2303,7 +2653,7 @@ I apologize, but I couldn't find specific information about {query_subject}. Cou
         club_name = club.get("Organization Name", "Unknown Club")
         description = club.get("Description", "No detailed description available.")
 
-        response = self.templates["club_info"].format(
+        response = self._render["club_info"](
             club_name=club_name, description=description
         )
 
@@ -2534,16 +2884,22 @@ class AcademicCalendarContext:
 class LlamaModelConfig:
     """Configuration for LLaMA model with optimized settings"""
 
-    def __init__(self, model_path):
+    def __init__(self, model_path, prompt_cache_capacity_mb=0):
         self.model_path = model_path
 
         # Default settings for optimal performance
         self.settings = {
             "n_ctx": 4096,  # Context window size
-            "n_batch": 512,  # Batch size for prompt processing
-            "n_threads": 8,  # CPU thread count
+            "n_batch": 2048,  # Batch size for prompt processing
+            "n_threads": min(16, os.cpu_count() or 8),  # CPU thread count
             "n_gpu_layers": 35,  # Number of layers to offload to GPU if available
             "use_mlock": True,  # Use mlock to keep model in memory
+            # Optional on-disk prompt KV cache (0 disables it). Every completion
+            # saves its full KV state there, so it is off unless given a size cap
+            "prompt_cache_dir": os.path.join(
+                os.path.dirname(os.path.abspath(__file__)), "prompt_cache"
+            ),
+            "prompt_cache_capacity_mb": prompt_cache_capacity_mb,
         }
 
     def initialize_model(self):
@@ -2576,6 +2932,23 @@ class LlamaModelConfig:
                 use_mlock=self.settings["use_mlock"],
             )
 
+            # Reuse evaluated prompt prefixes from disk across restarts, if enabled
+            capacity_mb = self.settings["prompt_cache_capacity_mb"]
+            if capacity_mb:
+                try:
+                    from llama_cpp import LlamaDiskCache
+
+                    model.set_cache(
+                        LlamaDiskCache(
+                            cache_dir=self.settings["prompt_cache_dir"],
+                            capacity_bytes=int(capacity_mb) << 20,
+                        )
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"Prompt cache unavailable, continuing without it: {e}"
+                    )
+
             logger.info(f"Successfully loaded LLaMA model from {self.model_path}")
             return model
 
@@ -2602,7 +2975,9 @@ class EnhancedUFAssistant:
         self.config = self._load_config(config_path)
 
         # Initialize embedding model
-        self.embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
+        self.embedding_model = _prepare_embedding_model(
+            SentenceTransformer("all-MiniLM-L6-v2")
+        )
         logger.info("Initialized embedding model")
 
         # Initialize LLaMA model if path is provided
@@ -2610,7 +2985,10 @@ class EnhancedUFAssistant:
         self.llm = None
 
         if llama_model_path:
-            llama_config = LlamaModelConfig(llama_model_path)
+            llama_config = LlamaModelConfig(
+                llama_model_path,
+                prompt_cache_capacity_mb=self.config.get("prompt_cache_capacity_mb", 0),
+            )
             self.llm = llama_config.initialize_model()
 
         # Load data using the provided loading functions
@@ -2629,6 +3007,7 @@ class EnhancedUFAssistant:
 
         # Cache for query results
         self.query_cache = LRUCache(capacity=100)
+        self.major_search_cache = MajorSearchCache()
 
         # Validate data integrity
         self._validate_data()
@@ -2698,13 +3077,12 @@ class EnhancedUFAssistant:
 
         # Check aliases if provided
         if aliases_dict:
-            for entity in entities:
-                entity_name = entity.get(name_key, "").lower()
-                for alias_key, aliases in aliases_dict.items():
-                    if alias_key == entity_name:
-                        for alias in aliases:
-                            if alias.lower() in query_lower:
-                                return entity
+            # One regex scan finds every alias mentioned in the query
+            mentioned = find_alias_mentions(query_lower, aliases_dict)
+            if mentioned:
+                for entity in entities:
+                    if entity.get(name_key, "").lower() in mentioned:
+                        return entity
 
         # Try course code pattern for courses
         if name_key == "Course Code":
@@ -2986,7 +3364,9 @@ class EnhancedUFAssistant:
                 if analysis.get("is_major_query") or self.query_analyzer.is_major_query(
                     query
                 ):
-                    major_response, found = search_major_info(query, self.HOME_DIR)
+                    major_response, found = self.major_search_cache.search(
+                        query, self.HOME_DIR
+                    )
                     if found:
                         major_info = {"response": major_response, "query": query}
                         self.conversation_state.set_active_major(major_info)
@@ -3057,6 +3437,10 @@ class EnhancedUFAssistant:
 # ------------------------------
 # Main Application
 # ------------------------------
+# Marker lines framing each response in --serve mode
+SERVE_RESPONSE_BEGIN = "<<<GATORNET_RESPONSE>>>"
+SERVE_RESPONSE_END = "<<<GATORNET_END>>>"
+
 if __name__ == "__main__":
     import argparse
     import sys
@@ -3064,6 +3448,11 @@ if __name__ == "__main__":
     # Create argument parser
     parser = argparse.ArgumentParser(description="UF Assistant")
     parser.add_argument("--query", type=str, help="Query to process")
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Answer JSON-encoded queries read from stdin, one per line",
+    )
 
     # Parse arguments
     args = parser.parse_args()
@@ -3071,6 +3460,9 @@ if __name__ == "__main__":
     # Initialize hydra
     hydra.initialize(config_path="conf")
 
+    # Parse the CSV data in the background while the models load
+    threading.Thread(target=prefetch_all, daemon=True).start()
+
     # Initialize the assistant
     assistant = EnhancedUFAssistant()
 
@@ -3080,6 +3472,19 @@ if __name__ == "__main__":
         response = assistant.process_query(args.query)
         # CRITICAL FIX: Make sure to print in a single line without buffering
         print(response, flush=True)
+    elif args.serve:
+        # Persistent mode used by the backend: the model stays loaded and each
+        # response is framed by marker lines so it can be found in stdout.
+        # Queries come from every user and conversation, so none of them may
+        # inherit another's conversation context.
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            assistant.reset_conversation()
+            response = assistant.process_query(json.loads(line))
+            print(SERVE_RESPONSE_BEGIN)
+            print(response)
+            print(SERVE_RESPONSE_END, flush=True)
     else:
         # Interactive mode
         print(
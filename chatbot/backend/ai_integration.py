@@ -1,71 +1,141 @@
 import sys
 import os
+import atexit
+import json
 import threading
+import queue
 import time
 from datetime import datetime
 import traceback
 import subprocess
 import re
 
+# Marker lines AI_model.py --serve prints around each response
+SERVE_RESPONSE_BEGIN = "<<<GATORNET_RESPONSE>>>"
+SERVE_RESPONSE_END = "<<<GATORNET_END>>>"
+
+# Bold headers that only end the response when used as a template header
+_TEMPLATE_HEADER_PATTERNS = {
+    "**Response**": re.compile(r'\*\*Response\*\*\s*[\n:]'),
+    "**Output**": re.compile(r'\*\*Output\*\*\s*[\n:]'),
+}
+# Inline hashtags (not markdown headers, which start a line)
+_HASHTAG_PATTERN = re.compile(r'(?<!\n)\s+#\s*[A-Za-z0-9]+')
+
+# Seconds to wait for a framed response (including the first model load) before
+# the AI process is considered hung and restarted
+RESPONSE_TIMEOUT = float(os.environ.get("AI_RESPONSE_TIMEOUT", "300"))
+
 class AIWrapper:
-    def __init__(self, model_path=None):
+    def __init__(self, model_path=None, response_timeout=RESPONSE_TIMEOUT):
         print("AIWrapper initialization started")
-        # We'll use subprocess to run the AI_model.py directly
+        # We keep one AI_model.py process running so the model is only loaded once
         self.model_path = model_path
         self.ai_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "AI")
         self.ai_script = os.path.join(self.ai_dir, "AI_model.py")
+        self.response_timeout = response_timeout
+        self._process = None
+        self._lines = None
+        self._process_lock = threading.Lock()
         
         # Verify the script exists
         if not os.path.exists(self.ai_script):
             print(f"AI script not found at: {self.ai_script}")
             raise FileNotFoundError(f"AI_model.py not found at {self.ai_script}")
         
+        # Start loading the model right away and make sure it goes away with us
+        self._start_process()
+        atexit.register(self.close)
+        
         print(f"AIWrapper initialized with script: {self.ai_script}")
-            
-    def process_query(self, query):
-        """Process a query by running the AI_model.py script directly"""
-        print(f"Processing query via direct script: '{query}'")
+    
+    def _start_process(self):
+        """Start the persistent AI_model.py process in serve mode"""
+        self._process = subprocess.Popen(
+            [sys.executable, self.ai_script, "--serve"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            cwd=os.path.dirname(self.ai_script)
+        )
+        # A reader thread feeds stdout into a queue so reads can time out
+        self._lines = queue.Queue()
+        threading.Thread(
+            target=self._pump_output, args=(self._process, self._lines), daemon=True
+        ).start()
+    
+    @staticmethod
+    def _pump_output(process, lines):
+        """Forward the process's stdout lines to the queue; None marks end of output"""
+        for line in process.stdout:
+            lines.put(line)
+        lines.put(None)
+    
+    def _read_line(self, deadline):
+        """Next stdout line from the AI process, or None once it has exited"""
         try:
-            # Run the AI model script with the query as input
-            result = subprocess.run(
-                [sys.executable, self.ai_script, "--query", query],
-                capture_output=True,
-                text=True,
-                cwd=os.path.dirname(self.ai_script)
+            return self._lines.get(timeout=max(deadline - time.monotonic(), 0))
+        except queue.Empty:
+            # The process is hung: kill it so the next query starts a fresh one
+            self._process.kill()
+            self._process.wait()
+            self._process = None
+            raise TimeoutError(
+                f"AI process gave no response within {self.response_timeout:.0f} seconds"
             )
-            
-            # Extract the response from the output
-            output = result.stdout
-            
-            # Find the model's response in the output (everything after the query)
+        
+    def close(self):
+        """Terminate the persistent AI process"""
+        if self._process is not None and self._process.poll() is None:
+            self._process.terminate()
             try:
-                # Look for the query line and take everything after it
-                query_line = f"> {query}"
-                if query_line in output:
-                    response_start = output.index(query_line) + len(query_line)
-                    response = output[response_start:].strip()
-                    
-                    # Remove any trailing prompt or other noise
-                    if ">" in response:
-                        response = response.split(">")[0].strip()
-                    
-                    # ADVANCED CLEANUP
-                    # Preserve markdown content but clean up after it
-                    response = self._clean_preserving_markdown(response)
-                        
-                    print(f"Response length: {len(response)} characters")
-                    return response
-                else:
-                    # If query pattern not found, try to extract meaningful response
-                    response = self._extract_meaningful_response(output)
-                    return response
-                    
-            except Exception as e:
-                print(f"Error parsing AI output: {e}")
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+            
+    def process_query(self, query):
+        """Process a query with the persistent AI_model.py process"""
+        print(f"Processing query via persistent AI process: '{query}'")
+        try:
+            with self._process_lock:
+                # Restart the process if it has exited since the last query
+                if self._process is None or self._process.poll() is not None:
+                    self._start_process()
+                
+                self._process.stdin.write(json.dumps(query) + "\n")
+                self._process.stdin.flush()
                 
+                # Skip any diagnostic output until the framed response
+                deadline = time.monotonic() + self.response_timeout
+                output = []
+                response_lines = None
+                while True:
+                    line = self._read_line(deadline)
+                    if line is None:
+                        # The process exited before finishing the response
+                        self._process.wait()
+                        output.extend(response_lines or [])
+                        response_lines = None
+                        break
+                    marker = line.rstrip("\n")
+                    if marker == SERVE_RESPONSE_BEGIN:
+                        response_lines = []
+                    elif marker == SERVE_RESPONSE_END and response_lines is not None:
+                        break
+                    elif response_lines is not None:
+                        response_lines.append(line)
+                    else:
+                        output.append(line)
+            
+            if response_lines is None:
                 # Last resort cleanup - try to extract meaningful response
-                response = self._extract_meaningful_response(output)
-                return response
+                return self._extract_meaningful_response("".join(output))
+            
+            # Preserve markdown content but clean up after it
+            response = self._clean_preserving_markdown("".join(response_lines))
+            print(f"Response length: {len(response)} characters")
+            return response
             
         except Exception as e:
             print(f"Error running AI script: {e}")
@@ -95,11 +165,10 @@ class AIWrapper:
             pos = text.find(marker)
             if pos != -1 and pos < earliest_pos:
                 # Don't cut at bold/italic markers that might be part of markdown
-                if marker in ["**Response**", "**Output**"]:
+                if marker in _TEMPLATE_HEADER_PATTERNS:
                     # Check if this is actually part of markdown formatting
                     # or if it appears to be a template header
-                    pattern = r'\*\*' + marker.strip('*') + r'\*\*\s*[\n:]'
-                    if re.search(pattern, text):
+                    if _TEMPLATE_HEADER_PATTERNS[marker].search(text):
                         earliest_pos = pos
                 else:
                     earliest_pos = pos
@@ -113,12 +182,13 @@ class AIWrapper:
         
         # Remove hashtags if they appear to be tags, not markdown headers
         # Markdown headers have # at start of line, tags usually have space before #
-        text = re.sub(r'(?<!\n)\s+#\s*[A-Za-z0-9]+', '', text)
+        text = _HASHTAG_PATTERN.sub('', text)
         
         # Remove template sections with "Hi there! I'm the UF Assistant" that repeat
-        if text.count("Hi there! I'm the UF Assistant") > 1:
-            parts = text.split("Hi there! I'm the UF Assistant")
-            text = "Hi there! I'm the UF Assistant" + parts[1]
+        greeting = "Hi there! I'm the UF Assistant"
+        _, found, rest = text.partition(greeting)
+        if found and greeting in rest:
+            text = greeting + rest.partition(greeting)[0]
             
         return text.strip()
         
@@ -161,7 +231,7 @@ class AIManager:
         self._initialization_error = None
         
         # Default model path - update this to your actual model path
-        self.model_path = "./AI/models/Meta-Llama-3-8B-Instruct-Q8_0.gguf"
+        self.model_path = "./AI/models/Meta-Llama-3-8B-Instruct-Q4_K_M.gguf"
         
         # Initialize the assistant right away
         print("Initializing Enhanced UF Assistant...")
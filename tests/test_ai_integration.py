@@ -0,0 +1,68 @@
+import unittest
+import os
+import sys
+import tempfile
+import textwrap
+from unittest.mock import MagicMock, patch
+
+# Importing ai_integration creates the AIManager singleton, which would start
+# the real AI process, so Popen is patched while the module loads
+with patch("subprocess.Popen", return_value=MagicMock()):
+    import ai_integration
+
+FAKE_SERVE_SCRIPT = textwrap.dedent('''
+    import json, sys, time
+    for line in sys.stdin:
+        query = json.loads(line)
+        print("diagnostic output before the response")
+        if query == "hang":
+            time.sleep(60)
+        if query == "crash":
+            print("partial answer")
+            sys.exit(1)
+        print("<<<GATORNET_RESPONSE>>>")
+        print("Answer to: " + query)
+        print("<<<GATORNET_END>>>", flush=True)
+''')
+
+
+class TestAIWrapperServeProtocol(unittest.TestCase):
+    def setUp(self):
+        with patch("subprocess.Popen", return_value=MagicMock()):
+            self.wrapper = ai_integration.AIWrapper(response_timeout=5)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.wrapper.ai_script = os.path.join(self.tmpdir.name, "fake_serve.py")
+        with open(self.wrapper.ai_script, "w") as f:
+            f.write(FAKE_SERVE_SCRIPT)
+        self.wrapper._start_process()
+
+    def tearDown(self):
+        self.wrapper.close()
+        self.tmpdir.cleanup()
+
+    def test_returns_only_the_framed_response(self):
+        response = self.wrapper.process_query("library hours")
+        self.assertEqual(response, "Answer to: library hours")
+        self.assertNotIn("diagnostic", response)
+
+    def test_process_is_reused_between_queries(self):
+        process = self.wrapper._process
+        self.assertEqual(self.wrapper.process_query("first"), "Answer to: first")
+        self.assertEqual(self.wrapper.process_query("second"), "Answer to: second")
+        self.assertIs(self.wrapper._process, process)
+
+    def test_restarts_after_the_process_exits(self):
+        self.wrapper.process_query("crash")
+        self.assertEqual(self.wrapper.process_query("again"), "Answer to: again")
+
+    def test_hung_process_is_killed_and_replaced(self):
+        self.wrapper.response_timeout = 1
+        response = self.wrapper.process_query("hang")
+        self.assertIn("error", response)
+        self.assertIsNone(self.wrapper._process)
+        self.wrapper.response_timeout = 5
+        self.assertEqual(self.wrapper.process_query("next"), "Answer to: next")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,236 @@
+import unittest
+import os
+import tempfile
+from unittest.mock import patch
+
+
+def write_file(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def bump_mtime(path):
+    # Make sure the new version gets a different mtime even on coarse filesystems
+    stamp = os.path.getmtime(path) + 10
+    os.utime(path, (stamp, stamp))
+
+
+class TestReadCsvColumns(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.tmpdir.name, "table.csv")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_short_and_long_rows_are_padded_and_trimmed(self):
+        from AI.AI_model import read_csv_columns
+
+        write_file(self.csv_path, "a,b,c\n1,2,3\n4\n\n5,6,7,8\n")
+        rows = list(read_csv_columns(self.csv_path, ("a", "c")))
+        # Short rows read None like DictReader, blank lines are skipped
+        self.assertEqual(rows, [("1", "3"), ("4", None), ("5", "7")])
+
+    def test_missing_column_reads_empty_string(self):
+        from AI.AI_model import read_csv_columns
+
+        write_file(self.csv_path, "a,b\n1,2\n3\n")
+        self.assertEqual(
+            list(read_csv_columns(self.csv_path, ("b", "missing"))),
+            [("2", ""), (None, "")],
+        )
+        self.assertEqual(
+            list(read_csv_columns(self.csv_path, ("missing",))), [("",), ("",)]
+        )
+
+
+class TestLoaderReloadsOnChange(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(
+            self.tmpdir.name, "scrapedData", "classes", "majors.csv"
+        )
+        write_file(self.csv_path, "department,description\nBiology,Life\n")
+        patcher = patch("AI.AI_model.HOME_DIR", self.tmpdir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        from AI.AI_model import load_majors_data
+
+        load_majors_data.cache_clear()
+        self.tmpdir.cleanup()
+
+    def test_result_is_cached_until_the_file_changes(self):
+        from AI.AI_model import load_majors_data
+
+        first = load_majors_data()
+        self.assertEqual(first, [{"Department": "Biology", "Description": "Life"}])
+        self.assertIs(load_majors_data(), first)
+
+        write_file(
+            self.csv_path, "department,description\nBiology,Life\nChemistry,Matter\n"
+        )
+        bump_mtime(self.csv_path)
+        self.assertEqual(
+            [major["Department"] for major in load_majors_data()],
+            ["Biology", "Chemistry"],
+        )
+
+    def test_missing_file_is_picked_up_once_created(self):
+        from AI.AI_model import load_majors_data
+
+        os.remove(self.csv_path)
+        self.assertEqual(load_majors_data(), [])
+        write_file(self.csv_path, "department,description\nBiology,Life\n")
+        self.assertEqual(len(load_majors_data()), 1)
+
+
+class TestFindAliasMentions(unittest.TestCase):
+    def setUp(self):
+        from AI.AI_model import _freeze_aliases
+
+        self.aliases = _freeze_aliases(
+            {
+                "library west": ["library west", "west"],
+                "marston science library": ["marston", "science library"],
+                "education library": ["education library", "norman"],
+            }
+        )
+
+    def test_every_alias_substring_counts(self):
+        from AI.AI_model import find_alias_mentions
+
+        self.assertEqual(
+            find_alias_mentions("is marston or library west open?", self.aliases),
+            {"marston science library", "library west"},
+        )
+        # "library west" also contains "west"; overlapping aliases are all reported
+        self.assertEqual(
+            find_alias_mentions("library west", self.aliases), {"library west"}
+        )
+        self.assertEqual(
+            find_alias_mentions("the science library", self.aliases),
+            {"marston science library"},
+        )
+
+    def test_no_mentions(self):
+        from AI.AI_model import find_alias_mentions
+
+        self.assertEqual(find_alias_mentions("where is the gym?", self.aliases), set())
+
+    def test_matches_plain_substring_search(self):
+        from AI.AI_model import find_alias_mentions
+
+        for query in [
+            "norman hall and west",
+            "westeducation library",
+            "marstonorman",
+            "",
+        ]:
+            expected = {
+                canon
+                for canon, aliases in self.aliases.items()
+                if any(alias in query for alias in aliases)
+            }
+            self.assertEqual(find_alias_mentions(query, self.aliases), expected, query)
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_least_recently_used_entry_is_evicted(self):
+        from AI.AI_model import LRUCache
+
+        cache = LRUCache(capacity=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        # Reading "a" makes "b" the least recently used
+        self.assertEqual(cache["a"], 1)
+        cache["c"] = 3
+        self.assertNotIn("b", cache)
+        self.assertIn("a", cache)
+        self.assertIn("c", cache)
+
+    def test_overwrite_refreshes_entry(self):
+        from AI.AI_model import LRUCache
+
+        cache = LRUCache(capacity=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache["a"] = 10
+        cache["c"] = 3
+        self.assertEqual(cache["a"], 10)
+        self.assertNotIn("b", cache)
+
+    def test_missing_key_and_clear(self):
+        from AI.AI_model import LRUCache
+
+        cache = LRUCache(capacity=2)
+        self.assertIsNone(cache["missing"])
+        cache["a"] = 1
+        cache.clear()
+        self.assertNotIn("a", cache)
+
+
+class TestMajorSearchCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.programs_path = os.path.join(
+            self.tmpdir.name, "scrapedData", "classes", "programs.csv"
+        )
+        write_file(self.programs_path, "Department,Name,URL,Type\n")
+        patcher = patch(
+            "AI.AI_model.search_major_info",
+            side_effect=lambda query, home_dir: (f"result for {query}", True),
+        )
+        self.search = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_same_major_shares_an_entry(self):
+        from AI.AI_model import MajorSearchCache
+
+        cache = MajorSearchCache()
+        first = cache.search("Tell me about computer science major", self.tmpdir.name)
+        again = cache.search(
+            "tell me about computer science major ", self.tmpdir.name
+        )
+        reworded = cache.search("I want to major in computer science", self.tmpdir.name)
+        self.assertEqual(self.search.call_count, 1)
+        self.assertEqual(first, again)
+        self.assertEqual(first, reworded)
+
+    def test_different_major_is_never_served_from_cache(self):
+        from AI.AI_model import MajorSearchCache
+
+        cache = MajorSearchCache()
+        cache.search("tell me about computer engineering major", self.tmpdir.name)
+        result = cache.search("tell me about electrical engineering major", self.tmpdir.name)
+        self.assertEqual(self.search.call_count, 2)
+        self.assertEqual(
+            result, ("result for tell me about electrical engineering major", True)
+        )
+
+    def test_entries_expire_when_data_changes(self):
+        from AI.AI_model import MajorSearchCache
+
+        cache = MajorSearchCache()
+        cache.search("biology major", self.tmpdir.name)
+        bump_mtime(self.programs_path)
+        cache.search("biology major", self.tmpdir.name)
+        self.assertEqual(self.search.call_count, 2)
+
+    def test_entries_are_per_data_directory(self):
+        from AI.AI_model import MajorSearchCache
+
+        cache = MajorSearchCache()
+        with tempfile.TemporaryDirectory() as other_dir:
+            cache.search("biology major", self.tmpdir.name)
+            cache.search("biology major", other_dir)
+        self.assertEqual(self.search.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()